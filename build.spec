@@ -1,8 +1,13 @@
 # -*- mode: python ; coding: utf-8 -*-
 # PyInstaller spec file for WoW Auto Fishing Tool
 
+import importlib.util
+
 block_cipher = None
 
+# 可选的 RMS 内核加速，仅在构建环境已安装 numba 时打包
+optional_imports = ['numba'] if importlib.util.find_spec('numba') else []
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -14,7 +19,7 @@ a = Analysis(
         'numpy',
         'sounddevice',
         'PyQt6',
-    ],
+    ] + optional_imports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -6,6 +6,7 @@ WoW 自动钓鱼工具
 
 import sys
 import os
+import platform
 
 # 确保能够导入 src 模块
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -15,6 +16,8 @@ from PyQt6.QtCore import Qt
 
 from src.gui import MainWindow
 
+IS_WINDOWS = platform.system() == "Windows"
+
 
 def main():
     """主函数"""
@@ -31,8 +34,18 @@ def main():
     window = MainWindow()
     window.show()
     
+    # Windows 默认计时器精度约 15ms，提升到 1ms 以保证按键延迟准确
+    if IS_WINDOWS:
+        import ctypes
+        ctypes.windll.winmm.timeBeginPeriod(1)
+    
     # 运行应用
-    sys.exit(app.exec())
+    try:
+        exit_code = app.exec()
+    finally:
+        if IS_WINDOWS:
+            ctypes.windll.winmm.timeEndPeriod(1)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
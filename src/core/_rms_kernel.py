@@ -0,0 +1,73 @@
+"""
+RMS 计算内核
+音频回调中的平方和 + 阈值比较，安装了 numba 时编译为机器码
+输入为 int16 采样，平方和在整数域累加
+"""
+
+import sys
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# int16 满量程的平方，用于把整数平方和换算回 0-1 范围
+INT16_FULL_SCALE_SQ = 32768.0 ** 2
+
+# NumPy 实现的 int64 暂存缓冲区，预热时按块大小分配，音频线程中复用
+_scratch = np.empty(0, dtype=np.int64)
+
+
+def _sum_square_and_trigger_py(buf: np.ndarray, threshold_sum: float) -> tuple[int, bool]:
+    """
+    计算第一声道的平方和并与阈值比较（NumPy 实现）
+
+    sqrt 单调递增，直接比较平方和即可省去每个块的开方和除法
+
+    Args:
+        buf: int16 音频数据，形状为 (帧数, 声道数)
+        threshold_sum: 换算到整数平方和量纲的有效阈值，
+            即 (阈值 + 噪音基准)² × 32768² × 帧数
+
+    Returns:
+        (平方和, 是否超过阈值)
+    """
+    global _scratch
+    n = buf.shape[0]
+    if _scratch.shape[0] < n:
+        _scratch = np.empty(n, dtype=np.int64)
+    flat = _scratch[:n]
+    # 写入预分配缓冲区，避免每个块构造新数组；int64 防止平方溢出
+    np.copyto(flat, buf[:, 0], casting='unsafe')
+    sum_sq = int(np.dot(flat, flat))
+    return sum_sq, sum_sq > threshold_sum
+
+
+if njit is not None:
+    # 显式签名让 numba 在导入时就完成编译（cache=True 时从磁盘缓存加载）
+    # 打包后的程序不附带源文件，numba 无法定位缓存目录，直接在启动时编译
+    @njit(
+        ['Tuple((i8, b1))(i2[:, :], f8)'],
+        cache=not getattr(sys, 'frozen', False), fastmath=True, boundscheck=False,
+    )
+    def sum_square_and_trigger(buf, threshold_sum):
+        s = 0
+        for i in range(buf.shape[0]):
+            v = np.int64(buf[i, 0])
+            s += v * v
+        return s, s > threshold_sum
+else:
+    sum_square_and_trigger = _sum_square_and_trigger_py
+
+
+def warm_up(block_size: int) -> None:
+    """
+    预热内核，让 numba 在进入音频线程前完成编译
+
+    Args:
+        block_size: 每次处理的采样数
+    """
+    sum_square_and_trigger(np.zeros((block_size, 1), dtype=np.int16), 0.0)
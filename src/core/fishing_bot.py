@@ -1,8 +1,10 @@
 """
 钓鱼机器人核心逻辑
 实现钓鱼状态机，协调声音检测和按键发送
+主流程以协程运行在单独线程的 asyncio 事件循环中
 """
 
+import asyncio
 import threading
 import time
 from enum import Enum, auto
@@ -14,6 +16,11 @@ from .sound_detector import SoundDetector
 from ..utils.config import Config
 
 
+# 主循环事件标志
+_SOUND_BIT = 1  # 检测到声音
+_STOP_BIT = 2   # 请求停止
+
+
 class FishingState(Enum):
     """钓鱼状态枚举"""
     IDLE = auto()        # 空闲状态
@@ -24,14 +31,14 @@ class FishingState(Enum):
     PAUSED = auto()      # 暂停状态
 
 
-@dataclass
+@dataclass(slots=True)
 class FishingStats:
     """钓鱼统计数据"""
     total_casts: int = 0      # 总抛竿次数
     successful_hooks: int = 0  # 成功收杆次数
     timeouts: int = 0         # 超时次数
     baits_applied: int = 0    # 上饵次数
-    start_time: float = 0     # 开始时间
+    start_time: float = 0     # 开始时间（time.perf_counter）
     
     @property
     def success_rate(self) -> float:
@@ -45,7 +52,7 @@ class FishingStats:
         """运行时间（秒）"""
         if self.start_time == 0:
             return 0
-        return time.time() - self.start_time
+        return time.perf_counter() - self.start_time
     
     def reset(self) -> None:
         """重置统计"""
@@ -70,6 +77,7 @@ class FishingBot:
         
         # 核心组件
         self._key_sender = KeySender()
+        self._preload_keys()
         self._sound_detector = SoundDetector(
             threshold=self._config.sound_threshold,
             callback=self._on_sound_detected
@@ -83,21 +91,26 @@ class FishingBot:
         # 统计
         self._stats = FishingStats()
         
-        # 线程
-        self._main_thread: Optional[threading.Thread] = None
-        self._timer_thread: Optional[threading.Thread] = None
+        # 事件循环，主流程作为协程运行在单独的线程中
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # 暂停控制，未暂停时处于 set 状态（仅在事件循环中访问）
+        self._resume_event: Optional[asyncio.Event] = None
         
         # 时间追踪
         self._last_cast_time = 0
         self._last_bait_time = 0
         self._waiting_start_time = 0
         
-        # 声音检测标志
-        self._sound_detected = threading.Event()
+        # 事件标志，声音回调和停止请求通过同一个事件唤醒主循环（仅在事件循环中访问）
+        self._wake_event: Optional[asyncio.Event] = None
+        self._event_flags = 0
         
         # 回调
         self._state_callback: Optional[Callable[[FishingState], None]] = None
         self._stats_callback: Optional[Callable[[FishingStats], None]] = None
+        self._combined_cb: Optional[Callable[[FishingState, FishingStats], None]] = None
         self._log_callback: Optional[Callable[[str], None]] = None
     
     @property
@@ -133,8 +146,26 @@ class FishingBot:
     def set_config(self, config: Config) -> None:
         """设置配置"""
         self._config = config
+        self._preload_keys()
         self._sound_detector.threshold = config.calculate_threshold_from_sensitivity()
     
+    def _preload_keys(self) -> None:
+        """预解析配置中的按键"""
+        self._key_sender.preload_keys(
+            self._config.pre_action_key,
+            self._config.fishing_key,
+            self._config.interact_key,
+        )
+    
+    def set_combined_callback(
+        self, callback: Callable[[FishingState, FishingStats], None]
+    ) -> None:
+        """
+        设置状态与统计合并回调
+        设置后状态变化和统计更新都只通过该回调通知，每个动作只触发一次
+        """
+        self._combined_cb = callback
+    
     def set_state_callback(self, callback: Callable[[FishingState], None]) -> None:
         """设置状态变化回调"""
         self._state_callback = callback
@@ -158,66 +189,127 @@ class FishingBot:
     def _set_state(self, state: FishingState) -> None:
         """设置状态并触发回调"""
         self._state = state
-        if self._state_callback:
+        if self._combined_cb:
+            self._combined_cb(state, self._stats)
+        elif self._state_callback:
             self._state_callback(state)
     
     def _update_stats(self) -> None:
         """更新统计并触发回调"""
+        if self._combined_cb:
+            self._combined_cb(self._state, self._stats)
+        elif self._stats_callback:
+            self._stats_callback(self._stats)
+    
+    def _emit(self, state: FishingState) -> None:
+        """设置状态并一次性通知状态和统计"""
+        self._state = state
+        if self._combined_cb:
+            self._combined_cb(state, self._stats)
+            return
+        if self._state_callback:
+            self._state_callback(state)
         if self._stats_callback:
             self._stats_callback(self._stats)
     
+    def _call_in_loop(self, callback: Callable, *args) -> None:
+        """从其他线程把调用投递到事件循环"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # 事件循环已关闭
+            pass
+    
+    def _post_flags(self, bits: int) -> None:
+        """设置事件标志并唤醒主循环（在事件循环中执行）"""
+        self._event_flags |= bits
+        self._wake_event.set()
+        if bits & _STOP_BIT:
+            self._resume_event.set()
+    
+    def _on_sound_in_loop(self) -> None:
+        """处理声音检测通知（在事件循环中执行）"""
+        if self._state == FishingState.WAITING:
+            self._post_flags(_SOUND_BIT)
+    
     def _on_sound_detected(self) -> None:
         """声音检测回调"""
-        if self._state == FishingState.WAITING:
-            self._sound_detected.set()
+        self._call_in_loop(self._on_sound_in_loop)
+    
+    async def _wait_flags(self, timeout: float) -> int:
+        """
+        等待事件标志或超时
+        
+        Args:
+            timeout: 超时时间（秒）
+            
+        Returns:
+            当前事件标志
+        """
+        if not self._event_flags:
+            self._wake_event.clear()
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return self._event_flags
+    
+    async def _sleep_random(self, min_ms: int, max_ms: int) -> bool:
+        """
+        随机延迟，收到停止请求时提前返回
+        
+        Returns:
+            是否完整等待（False 表示收到停止请求，调用方不应继续按键）
+        """
+        flags = await self._wait_flags(KeySender.get_random_delay(min_ms, max_ms))
+        return not flags & _STOP_BIT
     
-    def _do_pre_action(self) -> None:
+    async def _do_pre_action(self) -> None:
         """执行前置动作（上饵等）"""
-        self._set_state(FishingState.PRE_ACTION)
+        self._stats.baits_applied += 1
+        self._emit(FishingState.PRE_ACTION)
         self._log("执行前置动作...")
         
         # 按下前置动作键
         self._key_sender.press_key(self._config.pre_action_key)
-        self._stats.baits_applied += 1
         self._last_bait_time = time.time()
         
         # 等待动作完成（上饵需要一些时间）
-        KeySender.sleep_random(2000, 3000)
-        
-        self._update_stats()
+        await self._sleep_random(2000, 3000)
     
-    def _do_cast(self) -> None:
+    async def _do_cast(self) -> None:
         """执行抛竿"""
-        self._set_state(FishingState.CASTING)
+        self._stats.total_casts += 1
+        self._emit(FishingState.CASTING)
         self._log("抛竿中...")
         
         # 按下钓鱼键
         self._key_sender.press_key(self._config.fishing_key)
-        self._stats.total_casts += 1
         self._last_cast_time = time.time()
         
         # 等待抛竿动画完成
-        KeySender.sleep_random(1500, 2500)
-        
-        self._update_stats()
+        await self._sleep_random(1500, 2500)
     
-    def _do_hook(self) -> None:
+    async def _do_hook(self) -> None:
         """执行收杆"""
-        self._set_state(FishingState.HOOKING)
+        self._emit(FishingState.HOOKING)
         self._log("检测到鱼上钩，收杆!")
         
         # 随机延迟后按下交互键
         delay_min, delay_max = self._config.get_hook_delay_range()
-        KeySender.sleep_random(delay_min, delay_max)
+        if not await self._sleep_random(delay_min, delay_max):
+            return
         
         self._key_sender.press_key(self._config.interact_key)
         self._stats.successful_hooks += 1
+        self._update_stats()
         
         # 收杆后延迟
         cast_delay_min, cast_delay_max = self._config.get_cast_delay_range()
-        KeySender.sleep_random(cast_delay_min, cast_delay_max)
-        
-        self._update_stats()
+        await self._sleep_random(cast_delay_min, cast_delay_max)
     
     def _check_need_bait(self) -> bool:
         """检查是否需要上饵"""
@@ -227,43 +319,52 @@ class FishingBot:
         elapsed = time.time() - self._last_bait_time
         return elapsed >= self._config.bait_interval
     
-    def _main_loop(self) -> None:
+    def _run_loop(self) -> None:
+        """事件循环线程入口"""
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self._main_loop())
+        finally:
+            self._loop.close()
+    
+    async def _main_loop(self) -> None:
         """主循环"""
-        self._stats.start_time = time.time()
+        self._stats.start_time = time.perf_counter()
         
         while self._running:
-            # 检查暂停
-            if self._paused:
-                time.sleep(0.1)
-                continue
+            # 暂停时阻塞，直到恢复或停止
+            await self._resume_event.wait()
+            if not self._running:
+                break
             
             try:
                 # 检查是否需要上饵
                 if self._check_need_bait():
-                    self._do_pre_action()
+                    await self._do_pre_action()
                     if not self._running:
                         break
                 
                 # 抛竿
-                self._do_cast()
+                await self._do_cast()
                 if not self._running:
                     break
                 
                 # 等待鱼上钩
+                self._event_flags &= ~_SOUND_BIT
                 self._set_state(FishingState.WAITING)
                 self._waiting_start_time = time.time()
-                self._sound_detected.clear()
                 self._log("等待鱼上钩...")
                 
-                # 等待声音或超时
-                detected = self._sound_detected.wait(timeout=self._config.timeout)
+                # 等待声音、停止请求或超时
+                flags = await self._wait_flags(self._config.timeout)
+                self._event_flags &= ~_SOUND_BIT
                 
-                if not self._running:
+                if flags & _STOP_BIT:
                     break
                 
-                if detected:
+                if flags & _SOUND_BIT:
                     # 检测到声音，收杆
-                    self._do_hook()
+                    await self._do_hook()
                 else:
                     # 超时
                     self._log("超时，重新抛竿")
@@ -272,7 +373,7 @@ class FishingBot:
                 
             except Exception as e:
                 self._log(f"错误: {e}")
-                time.sleep(1)
+                await asyncio.sleep(1)
         
         self._set_state(FishingState.IDLE)
     
@@ -296,9 +397,14 @@ class FishingBot:
         self._paused = False
         self._stats.reset()
         
-        # 启动主线程
-        self._main_thread = threading.Thread(target=self._main_loop, daemon=True)
-        self._main_thread.start()
+        # 创建事件循环并在新线程中运行主流程
+        self._loop = asyncio.new_event_loop()
+        self._event_flags = 0
+        self._wake_event = asyncio.Event()
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
+        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._loop_thread.start()
         
         self._log("钓鱼机器人已启动")
         return True
@@ -307,22 +413,31 @@ class FishingBot:
         """停止钓鱼"""
         self._running = False
         self._paused = False
-        self._sound_detected.set()  # 唤醒等待中的线程
+        
+        # 唤醒暂停或等待中的主流程
+        self._call_in_loop(self._post_flags, _STOP_BIT)
         
         # 停止声音检测
         self._sound_detector.stop()
         
-        # 等待主线程结束
-        if self._main_thread and self._main_thread.is_alive():
-            self._main_thread.join(timeout=2)
+        # 等待事件循环线程结束
+        if self._loop_thread and self._loop_thread.is_alive():
+            self._loop_thread.join(timeout=2)
         
         self._set_state(FishingState.IDLE)
         self._log("钓鱼机器人已停止")
     
+    def shutdown(self) -> None:
+        """停止钓鱼并释放音频设备"""
+        if self._running:
+            self.stop()
+        self._sound_detector.shutdown()
+    
     def pause(self) -> None:
         """暂停钓鱼"""
         if self._running and not self._paused:
             self._paused = True
+            self._call_in_loop(self._resume_event.clear)
             self._set_state(FishingState.PAUSED)
             self._log("已暂停")
     
@@ -330,6 +445,7 @@ class FishingBot:
         """恢复钓鱼"""
         if self._running and self._paused:
             self._paused = False
+            self._call_in_loop(self._resume_event.set)
             self._log("已恢复")
     
     def toggle_pause(self) -> None:
@@ -3,48 +3,56 @@
 负责模拟键盘按键发送到游戏窗口
 """
 
+import functools
 import random
 import time
 from typing import Optional
 from pynput.keyboard import Key, Controller, KeyCode
 
 
+# 按键模块专用的随机数生成器，不与全局 random 共享状态
+_rng = random.Random()
+
+# 特殊按键映射，键名预先小写化
+_SPECIAL_KEYS = {
+    'space': Key.space,
+    'enter': Key.enter,
+    'tab': Key.tab,
+    'esc': Key.esc,
+    'escape': Key.esc,
+    'backspace': Key.backspace,
+    'delete': Key.delete,
+    'up': Key.up,
+    'down': Key.down,
+    'left': Key.left,
+    'right': Key.right,
+    'home': Key.home,
+    'end': Key.end,
+    'pageup': Key.page_up,
+    'pagedown': Key.page_down,
+    'f1': Key.f1,
+    'f2': Key.f2,
+    'f3': Key.f3,
+    'f4': Key.f4,
+    'f5': Key.f5,
+    'f6': Key.f6,
+    'f7': Key.f7,
+    'f8': Key.f8,
+    'f9': Key.f9,
+    'f10': Key.f10,
+    'f11': Key.f11,
+    'f12': Key.f12,
+    'shift': Key.shift,
+    'ctrl': Key.ctrl,
+    'alt': Key.alt,
+}
+
+
 class KeySender:
     """按键发送器"""
     
-    # 特殊按键映射
-    SPECIAL_KEYS = {
-        'space': Key.space,
-        'enter': Key.enter,
-        'tab': Key.tab,
-        'esc': Key.esc,
-        'escape': Key.esc,
-        'backspace': Key.backspace,
-        'delete': Key.delete,
-        'up': Key.up,
-        'down': Key.down,
-        'left': Key.left,
-        'right': Key.right,
-        'home': Key.home,
-        'end': Key.end,
-        'pageup': Key.page_up,
-        'pagedown': Key.page_down,
-        'f1': Key.f1,
-        'f2': Key.f2,
-        'f3': Key.f3,
-        'f4': Key.f4,
-        'f5': Key.f5,
-        'f6': Key.f6,
-        'f7': Key.f7,
-        'f8': Key.f8,
-        'f9': Key.f9,
-        'f10': Key.f10,
-        'f11': Key.f11,
-        'f12': Key.f12,
-        'shift': Key.shift,
-        'ctrl': Key.ctrl,
-        'alt': Key.alt,
-    }
+    # 特殊按键映射（键名均为小写）
+    SPECIAL_KEYS = _SPECIAL_KEYS
     
     def __init__(self):
         """初始化按键控制器"""
@@ -60,28 +68,18 @@ class KeySender:
         """
         self._enabled = enabled
     
-    def _parse_key(self, key_str: str) -> Key | KeyCode:
+    def preload_keys(self, *key_strs: str) -> None:
         """
-        解析按键字符串
+        预先解析按键，之后按键时直接命中缓存
         
         Args:
-            key_str: 按键字符串，如 'a', 'f1', 'space' 等
-            
-        Returns:
-            pynput 按键对象
+            *key_strs: 按键字符串
         """
-        key_lower = key_str.lower().strip()
-        
-        # 检查是否为特殊按键
-        if key_lower in self.SPECIAL_KEYS:
-            return self.SPECIAL_KEYS[key_lower]
-        
-        # 普通字符按键
-        if len(key_str) == 1:
-            return KeyCode.from_char(key_str.lower())
-        
-        # 尝试作为虚拟键码
-        raise ValueError(f"无法识别的按键: {key_str}")
+        for key_str in key_strs:
+            try:
+                _parse_key(key_str)
+            except ValueError as e:
+                print(f"按键预解析失败: {e}")
     
     def press_key(self, key_str: str) -> bool:
         """
@@ -97,10 +95,10 @@ class KeySender:
             return False
         
         try:
-            key = self._parse_key(key_str)
+            key = _parse_key(key_str)
             self._keyboard.press(key)
             # 短暂延迟模拟真实按键
-            time.sleep(random.uniform(0.05, 0.15))
+            _precise_sleep(time.perf_counter() + 0.05 + _rng.random() * 0.1)
             self._keyboard.release(key)
             return True
         except Exception as e:
@@ -125,8 +123,8 @@ class KeySender:
             是否成功
         """
         if delay_max_ms > 0:
-            delay_ms = random.randint(delay_min_ms, delay_max_ms)
-            time.sleep(delay_ms / 1000.0)
+            delay_ms = delay_min_ms + _rng.random() * (delay_max_ms - delay_min_ms)
+            _precise_sleep(time.perf_counter() + delay_ms / 1000.0)
         
         return self.press_key(key_str)
     
@@ -145,9 +143,9 @@ class KeySender:
             return False
         
         try:
-            key = self._parse_key(key_str)
+            key = _parse_key(key_str)
             self._keyboard.press(key)
-            time.sleep(duration_ms / 1000.0)
+            _precise_sleep(time.perf_counter() + duration_ms / 1000.0)
             self._keyboard.release(key)
             return True
         except Exception as e:
@@ -166,7 +164,7 @@ class KeySender:
         Returns:
             延迟时间（秒）
         """
-        return random.randint(min_ms, max_ms) / 1000.0
+        return (min_ms + _rng.random() * (max_ms - min_ms)) / 1000.0
     
     @staticmethod
     def sleep_random(min_ms: int, max_ms: int) -> None:
@@ -177,5 +175,51 @@ class KeySender:
             min_ms: 最小延迟（毫秒）
             max_ms: 最大延迟（毫秒）
         """
-        delay = random.randint(min_ms, max_ms) / 1000.0
-        time.sleep(delay)
+        delay = (min_ms + _rng.random() * (max_ms - min_ms)) / 1000.0
+        _precise_sleep(time.perf_counter() + delay)
+
+
+def _precise_sleep(deadline: float) -> None:
+    """
+    高精度睡眠到指定时刻
+    先用 time.sleep 睡到截止前约 1ms，再用 perf_counter 自旋补齐，
+    避免 Windows 默认约 15ms 的计时器精度
+    
+    Args:
+        deadline: 截止时刻（time.perf_counter 时间）
+    """
+    remaining = deadline - time.perf_counter() - 0.001
+    if remaining > 0:
+        time.sleep(remaining)
+    while time.perf_counter() < deadline:
+        pass
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_key(key_str: str) -> Key | KeyCode:
+    """
+    解析按键字符串，结果按原始字符串缓存
+    
+    Args:
+        key_str: 按键字符串，如 'a', 'f1', 'space' 等
+        
+    Returns:
+        pynput 按键对象
+    """
+    # 配置中的按键已经规范化，通常一次查表即可命中
+    special = _SPECIAL_KEYS.get(key_str)
+    if special is not None:
+        return special
+    
+    key_lower = key_str.lower().strip()
+    
+    # 检查是否为特殊按键
+    if key_lower in _SPECIAL_KEYS:
+        return _SPECIAL_KEYS[key_lower]
+    
+    # 普通字符按键
+    if len(key_str) == 1:
+        return KeyCode.from_char(key_str.lower())
+    
+    # 尝试作为虚拟键码
+    raise ValueError(f"无法识别的按键: {key_str}")
@@ -4,12 +4,18 @@
 支持 Windows (WASAPI Loopback) 和 macOS (BlackHole/Soundflower)
 """
 
+import ctypes
+import math
+import multiprocessing
 import platform
+import re
 import threading
 import time
 from typing import Callable, Optional, List
 import numpy as np
 
+from . import _rms_kernel
+
 try:
     import sounddevice as sd
 except ImportError:
@@ -21,10 +27,157 @@ except ImportError:
 IS_MACOS = platform.system() == "Darwin"
 IS_WINDOWS = platform.system() == "Windows"
 
+# 设备枚举缓存，避免短时间内重复调用 PortAudio 枚举
+_device_cache = {'t': 0.0, 'devices': None}
+
+
+def _cached_query_devices(ttl: float = 2.0) -> list:
+    """
+    获取带缓存的设备列表
+    
+    Args:
+        ttl: 缓存有效期（秒）
+        
+    Returns:
+        [(设备索引, 设备信息, 小写设备名), ...]
+    """
+    now = time.monotonic()
+    if _device_cache['devices'] is None or now - _device_cache['t'] > ttl:
+        _device_cache['devices'] = [
+            (i, d, d['name'].lower()) for i, d in enumerate(sd.query_devices())
+        ]
+        _device_cache['t'] = now
+    return _device_cache['devices']
+
+
+# Windows THREAD_PRIORITY_TIME_CRITICAL
+_THREAD_PRIORITY_TIME_CRITICAL = 15
+# OpenThread 访问权限：THREAD_SET_INFORMATION | THREAD_QUERY_INFORMATION
+_THREAD_SET_QUERY_INFORMATION = 0x0060
+
+
+def _elevate_thread_priority() -> Optional[tuple]:
+    """
+    提升当前线程（PortAudio 音频线程）的调度优先级
+    Windows: 设为 TIME_CRITICAL 并注册 MMCSS "Pro Audio" 任务
+    其他平台不处理，macOS 的 CoreAudio 线程本身已是实时线程
+    
+    音频回调是 Python 代码，运行前仍需获取 GIL。其他线程持有 GIL 时
+    提升优先级也不能让回调立即执行，只能缩短 GIL 释放后被调度的延迟
+    
+    Returns:
+        恢复时使用的 (线程句柄, 原优先级, MMCSS 句柄)，未提升时返回 None
+    """
+    if not IS_WINDOWS:
+        return None
+    try:
+        kernel32 = ctypes.windll.kernel32
+        avrt = ctypes.windll.avrt
+        kernel32.OpenThread.restype = ctypes.c_void_p
+        avrt.AvSetMmThreadCharacteristicsW.restype = ctypes.c_void_p
+        # GetCurrentThread 返回的伪句柄只在本线程有效，打开真实句柄以便关闭音频流时恢复
+        thread = kernel32.OpenThread(
+            _THREAD_SET_QUERY_INFORMATION, False, kernel32.GetCurrentThreadId()
+        )
+        if not thread:
+            return None
+        old_priority = kernel32.GetThreadPriority(ctypes.c_void_p(thread))
+        kernel32.SetThreadPriority(ctypes.c_void_p(thread), _THREAD_PRIORITY_TIME_CRITICAL)
+        task_index = ctypes.c_ulong(0)
+        mmcss = avrt.AvSetMmThreadCharacteristicsW("Pro Audio", ctypes.byref(task_index))
+        return thread, old_priority, mmcss
+    except (OSError, AttributeError):
+        return None
+
+
+def _restore_thread_priority(state: tuple) -> None:
+    """
+    撤销 _elevate_thread_priority 的修改并释放句柄
+    
+    Args:
+        state: _elevate_thread_priority 的返回值
+    """
+    thread, old_priority, mmcss = state
+    try:
+        kernel32 = ctypes.windll.kernel32
+        if mmcss:
+            ctypes.windll.avrt.AvRevertMmThreadCharacteristics(ctypes.c_void_p(mmcss))
+        kernel32.SetThreadPriority(ctypes.c_void_p(thread), old_priority)
+        kernel32.CloseHandle(ctypes.c_void_p(thread))
+    except (OSError, AttributeError):
+        pass
+
+
+class VolumeHistory:
+    """
+    音量历史环形缓冲区
+    音频线程每个窗口写入一个点，GUI 线程直接读取绘制，无需逐点转发
+    """
+    
+    __slots__ = ('_buf', '_size', 'count')
+    
+    def __init__(self, size: int = 300):
+        """
+        初始化环形缓冲区
+        
+        Args:
+            size: 保存的数据点数
+        """
+        self._buf = np.zeros(size, dtype=np.float32)
+        self._size = size
+        # 累计写入的点数，对容量取模即为下一个写入位置
+        self.count = 0
+    
+    @property
+    def size(self) -> int:
+        """缓冲区容量"""
+        return self._size
+    
+    def push(self, volume: float) -> None:
+        """写入一个音量数据点"""
+        count = self.count
+        self._buf[count % self._size] = volume
+        self.count = count + 1
+    
+    def latest(self) -> float:
+        """获取最新的数据点"""
+        return float(self._buf[(self.count - 1) % self._size])
+    
+    def peak(self) -> float:
+        """获取缓冲区内的最大值"""
+        return float(self._buf.max())
+    
+    def snapshot(self) -> tuple[np.ndarray, int]:
+        """
+        按时间顺序获取全部数据点
+        
+        Returns:
+            (从旧到新的音量数组, 累计写入点数)
+        """
+        count = self.count
+        start = count % self._size
+        return np.concatenate((self._buf[start:], self._buf[:start])), count
+    
+    def clear(self) -> None:
+        """清空数据（累计点数保持递增，触发标记位置仍然有效）"""
+        self._buf.fill(0.0)
+
 
 class SoundDetector:
     """声音检测器"""
     
+    # 固定实例属性，回调中的属性读取走槽位而非实例字典
+    __slots__ = (
+        '_threshold', '_callback', '_sample_rate', '_block_size',
+        '_running', '_stream', '_stream_device', '_thread', '_alive', '_run_event',
+        '_prio_set', '_prio_state', '_last_status_flag', '_status_count', '_trigger_event',
+        '_last_trigger_ns', '_trigger_cooldown', '_trigger_cooldown_ns',
+        '_vol_cell', '_history', '_window', '_win_sum', '_win_n', '_noise_floor',
+        '_threshold_ms',
+        '_calibrating', '_cal_sum', '_cal_count',
+        '_device_index', '_device_name',
+    )
+    
     # macOS 常见虚拟音频设备关键词
     MACOS_VIRTUAL_DEVICES = [
         'blackhole',
@@ -43,12 +196,23 @@ class SoundDetector:
         'wave out',
     ]
     
+    # 关键词预编译为单个正则，一次扫描完成全部匹配
+    _MACOS_VIRTUAL_RE = re.compile('|'.join(map(re.escape, MACOS_VIRTUAL_DEVICES)), re.IGNORECASE)
+    _WINDOWS_LOOPBACK_RE = re.compile('|'.join(map(re.escape, WINDOWS_LOOPBACK_DEVICES)), re.IGNORECASE)
+    
+    # 音量显示与历史记录的窗口采样数（2048 @ 22.05 kHz 约 93ms，约 10 Hz），触发按单个音频块判断
+    # 按 sample_rate 设定，设备实际采样率不同时等比换算，窗口时长保持不变
+    RMS_WINDOW = 2048
+    
+    # 音量历史保存的窗口数（约 30 秒）
+    HISTORY_SIZE = 300
+    
     def __init__(
         self,
         threshold: float = 0.02,
         callback: Optional[Callable[[], None]] = None,
-        sample_rate: int = 44100,
-        block_size: int = 1024
+        sample_rate: int = 22050,
+        block_size: int = 512
     ):
         """
         初始化声音检测器
@@ -56,33 +220,70 @@ class SoundDetector:
         Args:
             threshold: 音量阈值（0-1），超过此值触发回调
             callback: 检测到声音时的回调函数
-            sample_rate: 采样率
-            block_size: 每次处理的采样数
+            sample_rate: 采样率。只需检测浮标溅水的瞬态音量，不需要还原
+                语音或音乐，22.05 kHz 足够
+            block_size: 每次处理的采样数（512 @ 22.05 kHz 约 23ms）
         """
-        self._threshold = threshold
+        self._threshold = max(0.001, min(1.0, threshold))
         self._callback = callback
         self._sample_rate = sample_rate
         self._block_size = block_size
         
         self._running = False
         self._stream: Optional[sd.InputStream] = None
+        self._stream_device: Optional[int] = None
         self._thread: Optional[threading.Thread] = None
+        # 工作线程存活标记（shutdown 时清除），以及监听中标记（停止期间工作线程阻塞等待）
+        self._alive = False
+        self._run_event = threading.Event()
+        
+        # 音频线程优先级只需在首次回调时提升一次，关闭音频流时恢复
+        self._prio_set = False
+        self._prio_state: Optional[tuple] = None
+        
+        # 音频线程只记录状态和次数，由工作线程负责打印
+        self._last_status_flag = None
+        self._status_count = 0
+        
+        # 触发事件，由常驻工作线程等待并执行回调
+        self._trigger_event = threading.Event()
         
         # 用于防止重复触发
-        self._last_trigger_time = 0
+        self._last_trigger_ns = 0
         self._trigger_cooldown = 1.0  # 触发冷却时间（秒）
-        
-        # 当前音量（用于 UI 显示）
-        self._current_volume = 0.0
+        self._trigger_cooldown_ns = int(self._trigger_cooldown * 1e9)
+        
+        # 当前音量（用于 UI 显示），每个窗口结束时才开方更新
+        # 使用 C double 存储，GUI 线程读取时无需加锁
+        self._vol_cell = multiprocessing.RawValue('d', 0.0)
+        # 每个窗口的音量历史，供波形图直接读取
+        self._history = VolumeHistory(self.HISTORY_SIZE)
+        # 按实际采样率换算后的窗口采样数
+        self._window = self.RMS_WINDOW
+        # 窗口内的平方和与采样数，跨多个音频块累加
+        self._win_sum = 0
+        self._win_n = 0
         
         # 背景噪音基准
         self._noise_floor = 0.0
+        
+        # int16 量纲的有效均方阈值，仅在阈值或噪音基准变化时重新计算
+        self._threshold_ms = 0.0
+        self._update_effective_threshold()
         self._calibrating = False
-        self._calibration_samples: List[float] = []
+        # 校准期间的窗口音量累加和与窗口数，音频线程中只做标量累加
+        self._cal_sum = 0.0
+        self._cal_count = 0
         
         # 音频设备
         self._device_index: Optional[int] = None
         self._device_name: str = ""
+        
+        # 预热 RMS 内核，避免在音频线程中首次编译
+        _rms_kernel.warm_up(block_size)
+        
+        # 常驻回调工作线程，start/stop 只切换监听状态，不会出现多个工作线程
+        self._ensure_worker()
     
     @property
     def threshold(self) -> float:
@@ -93,11 +294,33 @@ class SoundDetector:
     def threshold(self, value: float) -> None:
         """设置阈值"""
         self._threshold = max(0.001, min(1.0, value))
+        self._update_effective_threshold()
+    
+    @property
+    def noise_floor(self) -> float:
+        """获取噪音基准"""
+        return self._noise_floor
+    
+    @noise_floor.setter
+    def noise_floor(self, value: float) -> None:
+        """设置噪音基准"""
+        self._noise_floor = max(0.0, float(value))
+        self._update_effective_threshold()
+    
+    def _update_effective_threshold(self) -> None:
+        """重新计算平方和量纲的有效阈值"""
+        effective = self._threshold + self._noise_floor
+        self._threshold_ms = effective * effective * _rms_kernel.INT16_FULL_SCALE_SQ
     
     @property
     def current_volume(self) -> float:
         """获取当前音量"""
-        return self._current_volume
+        return self._vol_cell.value
+    
+    @property
+    def volume_history(self) -> VolumeHistory:
+        """获取音量历史环形缓冲区"""
+        return self._history
     
     @property
     def is_running(self) -> bool:
@@ -111,6 +334,12 @@ class SoundDetector:
     def set_trigger_cooldown(self, seconds: float) -> None:
         """设置触发冷却时间"""
         self._trigger_cooldown = seconds
+        self._trigger_cooldown_ns = int(seconds * 1e9)
+    
+    @staticmethod
+    def invalidate_device_cache() -> None:
+        """清除设备枚举缓存，下次查询时重新枚举"""
+        _device_cache['devices'] = None
     
     @staticmethod
     def get_audio_devices() -> List[dict]:
@@ -123,35 +352,39 @@ class SoundDetector:
         if sd is None:
             return []
         
-        devices = []
+        pattern = SoundDetector._virtual_device_pattern()
         try:
-            device_list = sd.query_devices()
-            for i, device in enumerate(device_list):
-                # 只获取输入设备（包括 loopback）
-                if device['max_input_channels'] > 0:
-                    devices.append({
-                        'index': i,
-                        'name': device['name'],
-                        'channels': device['max_input_channels'],
-                        'sample_rate': device['default_samplerate'],
-                        'is_virtual': SoundDetector._is_virtual_device(device['name'])
-                    })
+            # 只获取输入设备（包括 loopback）
+            return [
+                {
+                    'index': i,
+                    'name': device['name'],
+                    'channels': device['max_input_channels'],
+                    'sample_rate': device['default_samplerate'],
+                    'is_virtual': pattern is not None and pattern.search(name) is not None
+                }
+                for i, device, name in _cached_query_devices()
+                if device['max_input_channels'] > 0
+            ]
         except Exception as e:
             print(f"获取音频设备失败: {e}")
         
-        return devices
+        return []
     
     @staticmethod
-    def _is_virtual_device(name: str) -> bool:
-        """检查是否为虚拟音频设备"""
-        name_lower = name.lower()
-        
+    def _virtual_device_pattern() -> Optional[re.Pattern]:
+        """获取当前平台的虚拟音频设备匹配正则，不支持的平台返回 None"""
         if IS_MACOS:
-            return any(kw in name_lower for kw in SoundDetector.MACOS_VIRTUAL_DEVICES)
+            return SoundDetector._MACOS_VIRTUAL_RE
         elif IS_WINDOWS:
-            return any(kw in name_lower for kw in SoundDetector.WINDOWS_LOOPBACK_DEVICES)
-        
-        return False
+            return SoundDetector._WINDOWS_LOOPBACK_RE
+        return None
+    
+    @staticmethod
+    def _is_virtual_device(name: str) -> bool:
+        """检查是否为虚拟音频设备"""
+        pattern = SoundDetector._virtual_device_pattern()
+        return pattern is not None and pattern.search(name) is not None
     
     @staticmethod
     def get_loopback_device() -> tuple[Optional[int], str]:
@@ -167,20 +400,15 @@ class SoundDetector:
             return None, ""
         
         try:
-            devices = sd.query_devices()
-            
             # 根据平台选择关键词
             if IS_MACOS:
-                keywords = SoundDetector.MACOS_VIRTUAL_DEVICES
+                pattern = SoundDetector._MACOS_VIRTUAL_RE
             else:
-                keywords = SoundDetector.WINDOWS_LOOPBACK_DEVICES
+                pattern = SoundDetector._WINDOWS_LOOPBACK_RE
             
-            for i, device in enumerate(devices):
-                name = device['name'].lower()
-                if device['max_input_channels'] > 0:
-                    for keyword in keywords:
-                        if keyword in name:
-                            return i, device['name']
+            for i, device, name in _cached_query_devices():
+                if device['max_input_channels'] > 0 and pattern.search(name):
+                    return i, device['name']
         except Exception as e:
             print(f"查找 loopback 设备失败: {e}")
         
@@ -216,38 +444,112 @@ class SoundDetector:
         self._device_index = device_index
         self._device_name = device_name
     
-    def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
+    def _make_audio_callback(self) -> Callable:
         """
-        音频流回调函数
+        构建音频流回调函数
         
-        Args:
-            indata: 输入音频数据
-            frames: 帧数
-            time_info: 时间信息
-            status: 状态
-        """
-        if status:
-            print(f"音频状态: {status}")
+        不变的对象和函数在闭包中绑定为局部变量，回调中通过快速局部访问读取；
+        阈值、冷却等可变状态仍从实例读取
         
-        # 计算 RMS 音量
-        volume = np.sqrt(np.mean(indata ** 2))
-        self._current_volume = float(volume)
-        
-        # 校准模式
-        if self._calibrating:
-            self._calibration_samples.append(volume)
-            return
-        
-        # 检测是否超过阈值
-        current_time = time.time()
-        effective_threshold = self._threshold + self._noise_floor
+        Returns:
+            传给 sd.InputStream 的回调函数
+        """
+        kernel = _rms_kernel.sum_square_and_trigger
+        sqrt = math.sqrt
+        perf_counter_ns = time.perf_counter_ns
+        vol_cell = self._vol_cell
+        push_history = self._history.push
+        notify = self._trigger_event.set
+        full_scale_sq = _rms_kernel.INT16_FULL_SCALE_SQ
+        
+        def audio_callback(indata: np.ndarray, frames: int, time_info, status) -> None:
+            """
+            音频流回调函数
+            
+            Args:
+                indata: 输入音频数据
+                frames: 帧数
+                time_info: 时间信息
+                status: 状态
+            """
+            # 停止监听期间音频流仍然打开，直接丢弃数据
+            if not self._running:
+                return
+            
+            if not self._prio_set:
+                self._prio_state = _elevate_thread_priority()
+                self._prio_set = True
+            
+            if status:
+                self._last_status_flag = status
+                self._status_count += 1
+            
+            # 计算整数平方和，并逐块与有效阈值（阈值 + 噪音基准）比较。
+            # 短促的溅水声只持续一两个块，按窗口判断会被其余安静块稀释
+            sum_sq, triggered = kernel(indata, self._threshold_ms * frames)
+            
+            # 校准期间和未设置回调时（仅监视音量）无需判断触发
+            if triggered and not self._calibrating and self._callback is not None:
+                now_ns = perf_counter_ns()
+                if now_ns - self._last_trigger_ns > self._trigger_cooldown_ns:
+                    self._last_trigger_ns = now_ns
+                    # 通知工作线程执行回调，避免在音频流中创建线程
+                    notify()
+            
+            # 跨块累加，窗口满时才计算音量并写入音量历史
+            win_sum = self._win_sum + sum_sq
+            win_n = self._win_n + frames
+            if win_n < self._window:
+                self._win_sum = win_sum
+                self._win_n = win_n
+                return
+            
+            self._win_sum = 0
+            self._win_n = 0
+            volume = sqrt(win_sum / (win_n * full_scale_sq))
+            vol_cell.value = volume
+            push_history(volume)
+            
+            # 校准模式只累计窗口音量
+            if self._calibrating:
+                self._cal_sum += volume
+                self._cal_count += 1
         
-        if (volume > effective_threshold and 
-            current_time - self._last_trigger_time > self._trigger_cooldown):
-            self._last_trigger_time = current_time
-            if self._callback:
-                # 在新线程中调用回调，避免阻塞音频流
-                threading.Thread(target=self._callback, daemon=True).start()
+        return audio_callback
+    
+    def _ensure_worker(self) -> None:
+        """确保常驻工作线程在运行，仅在线程不存在或已退出时创建"""
+        self._alive = True
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._trigger_loop, daemon=True)
+            self._thread.start()
+    
+    def _trigger_loop(self) -> None:
+        """常驻工作线程，在音频线程之外执行检测回调；停止监听期间阻塞等待，不产生定时唤醒"""
+        while self._alive:
+            if not self._running:
+                self._run_event.wait()
+                continue
+            
+            triggered = self._trigger_event.wait(timeout=0.5)
+            if not self._alive:
+                break
+            
+            status = self._last_status_flag
+            if status is not None:
+                self._last_status_flag = None
+                count = self._status_count
+                self._status_count = 0
+                print(f"音频状态: {status}（{count} 次）")
+            
+            if not triggered:
+                continue
+            self._trigger_event.clear()
+            if not self._running:
+                continue
+            callback = self._callback
+            if callback:
+                callback()
     
     def start(self) -> bool:
         """
@@ -279,15 +581,31 @@ class SoundDetector:
                     print("提示: Windows 需要启用立体声混音 (Stereo Mix)")
                 return False
             
-            self._stream = sd.InputStream(
-                device=device,
-                channels=1,
-                samplerate=self._sample_rate,
-                blocksize=self._block_size,
-                callback=self._audio_callback
-            )
-            self._stream.start()
+            # 音频流在多次 start/stop 之间保持打开，只有设备变化或流失效时才重新打开
+            if self._stream is None or self._stream_device != device or not self._stream.active:
+                self._close_stream()
+                self._prio_set = False
+                try:
+                    self._stream = self._open_stream(device, self._sample_rate)
+                except sd.PortAudioError:
+                    # 设备不支持该采样率时使用设备默认采样率，窗口按实际采样率换算
+                    self._stream = self._open_stream(device, None)
+                self._apply_stream_rate(self._stream.samplerate)
+                self._stream.start()
+                self._stream_device = device
+            
+            # 清掉停止前残留的窗口累加值和音量，重新开始时不混入旧数据
+            # （停止期间音频回调直接返回，不会并发修改这些值）
+            self._win_sum = 0
+            self._win_n = 0
+            self._vol_cell.value = 0.0
+            
+            # 丢弃停止前遗留的触发，再唤醒工作线程
+            self._trigger_event.clear()
+            self._ensure_worker()
             self._running = True
+            self._run_event.set()
+            
             self._device_index = device
             self._device_name = device_name
             print(f"声音检测已启动，设备: {device_name} (索引: {device})")
@@ -298,10 +616,61 @@ class SoundDetector:
                 print("提示: 请确保已安装 BlackHole 并在系统偏好设置中正确配置")
             return False
     
+    def _apply_stream_rate(self, samplerate: float) -> None:
+        """
+        按音频流的实际采样率换算窗口采样数
+        
+        回退到设备默认采样率时窗口时长（约 93ms）和音量历史的时间跨度保持不变
+        
+        Args:
+            samplerate: 音频流实际采样率
+        """
+        window = round(self.RMS_WINDOW * samplerate / self._sample_rate)
+        self._window = max(self._block_size, int(window))
+    
+    def _open_stream(self, device: int, samplerate: Optional[int]) -> "sd.InputStream":
+        """
+        创建音频输入流
+        
+        Args:
+            device: 设备索引
+            samplerate: 采样率，None 表示使用设备默认值
+            
+        Returns:
+            音频输入流
+        """
+        return sd.InputStream(
+            device=device,
+            channels=1,
+            # 以 int16 采集，RMS 内核直接在整数域计算平方和
+            dtype='int16',
+            samplerate=samplerate,
+            blocksize=self._block_size,
+            latency='low',
+            callback=self._make_audio_callback()
+        )
+    
     def stop(self) -> None:
-        """停止监听"""
+        """停止监听，音频流和工作线程保持运行以便快速重新开始"""
+        # 先清除监听事件再置标记，工作线程看到停止后即阻塞等待
+        self._run_event.clear()
         self._running = False
-        
+    
+    def shutdown(self) -> None:
+        """停止监听，结束工作线程并关闭音频流"""
+        self.stop()
+        
+        # 唤醒并等待工作线程退出
+        self._alive = False
+        self._run_event.set()
+        self._trigger_event.set()
+        if (self._thread and self._thread.is_alive()
+                and self._thread is not threading.current_thread()):
+            self._thread.join(timeout=1)
+        self._close_stream()
+    
+    def _close_stream(self) -> None:
+        """关闭音频流"""
         if self._stream:
             try:
                 self._stream.stop()
@@ -310,6 +679,11 @@ class SoundDetector:
                 print(f"停止音频流失败: {e}")
             finally:
                 self._stream = None
+                self._stream_device = None
+                # 音频流停止后回调不再运行，恢复音频线程的优先级并注销 MMCSS 任务
+                if self._prio_state is not None:
+                    _restore_thread_priority(self._prio_state)
+                    self._prio_state = None
     
     def calibrate(self, duration: float = 2.0) -> float:
         """
@@ -325,21 +699,22 @@ class SoundDetector:
             print("请先启动声音检测")
             return 0.0
         
+        self._cal_sum = 0.0
+        self._cal_count = 0
         self._calibrating = True
-        self._calibration_samples = []
         
         # 等待采样
         time.sleep(duration)
         
         self._calibrating = False
         
-        if self._calibration_samples:
+        if self._cal_count:
             # 使用平均值的 1.5 倍作为噪音基准
-            self._noise_floor = np.mean(self._calibration_samples) * 1.5
+            self.noise_floor = self._cal_sum / self._cal_count * 1.5
             print(f"噪音基准: {self._noise_floor:.4f}")
         
         return self._noise_floor
     
     def reset_calibration(self) -> None:
         """重置校准"""
-        self._noise_floor = 0.0
+        self.noise_floor = 0.0
@@ -4,14 +4,18 @@ PyQt6 图形界面实现
 """
 
 import platform
+import threading
+import time
+from collections import deque
+from typing import Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QGroupBox, QLineEdit,
-    QSlider, QSpinBox, QTextEdit, QProgressBar,
-    QFrame, QGridLayout, QMessageBox, QComboBox
+    QSlider, QSpinBox, QPlainTextEdit, QProgressBar,
+    QFrame, QGridLayout, QMessageBox, QComboBox, QStackedWidget
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool
 from PyQt6.QtGui import QFont, QKeySequence, QShortcut
 
 from ..core.fishing_bot import FishingBot, FishingState, FishingStats
@@ -21,12 +25,236 @@ from .volume_graph import VolumeGraph
 
 IS_MACOS = platform.system() == "Darwin"
 
+# 样式表在导入时构建一次，各处直接引用
+_MAIN_QSS = """
+    QMainWindow {
+        background-color: #2b2b2b;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #3c3c3c;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+        color: #e0e0e0;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QLabel {
+        color: #e0e0e0;
+    }
+    QLineEdit, QSpinBox {
+        background-color: #3c3c3c;
+        border: 1px solid #4a4a4a;
+        border-radius: 3px;
+        padding: 5px;
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #4a4a4a;
+        border: 1px solid #5a5a5a;
+        border-radius: 5px;
+        padding: 8px 15px;
+        color: #e0e0e0;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+    }
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+    QPushButton#startButton {
+        background-color: #2d5a27;
+        border-color: #3d7a37;
+    }
+    QPushButton#startButton:hover {
+        background-color: #3d7a37;
+    }
+    QPushButton#startButton[running="true"] {
+        background-color: #8b2500;
+        border-color: #a03000;
+    }
+    QPushButton#startButton[running="true"]:hover {
+        background-color: #a03000;
+    }
+    QPushButton#testAudioButton {
+        background-color: #2d5a27;
+    }
+    QPushButton#testAudioButton[active="true"] {
+        background-color: #8b2500;
+    }
+    QPlainTextEdit {
+        background-color: #1e1e1e;
+        border: 1px solid #3c3c3c;
+        border-radius: 3px;
+        color: #b0b0b0;
+        font-family: Consolas, monospace;
+    }
+    QSlider::groove:horizontal {
+        height: 8px;
+        background: #3c3c3c;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        width: 16px;
+        margin: -4px 0;
+        background: #5a9bd5;
+        border-radius: 8px;
+    }
+    QProgressBar {
+        border: 1px solid #3c3c3c;
+        border-radius: 3px;
+        background-color: #2b2b2b;
+    }
+    QProgressBar::chunk {
+        background-color: #5a9bd5;
+        border-radius: 2px;
+    }
+    QLabel#statusLabel {
+        font-weight: bold;
+        color: #5a9bd5;
+    }
+    QLabel#hintLabel {
+        color: gray;
+        font-size: 11px;
+    }
+    QLabel#warningHintLabel {
+        color: #f0ad4e;
+        font-size: 11px;
+    }
+"""
+
+# 状态显示名称
+_STATE_NAMES = {
+    FishingState.IDLE: "空闲",
+    FishingState.PRE_ACTION: "上饵中",
+    FishingState.CASTING: "抛竿中",
+    FishingState.WAITING: "等待上钩",
+    FishingState.HOOKING: "收杆中",
+    FishingState.PAUSED: "已暂停",
+}
+
+# 音频启动失败提示，按平台在导入时选定
+if IS_MACOS:
+    _MONITOR_FAILED_MSG = (
+        "无法启动音频监听。\n\n"
+        "请确保已选择正确的音频设备。\n"
+        "macOS 需要安装 BlackHole 等虚拟音频设备。"
+    )
+    _START_FAILED_MSG = (
+        "无法启动声音检测。\n\n"
+        "macOS 需要安装虚拟音频设备来捕获系统声音：\n"
+        "1. 安装 BlackHole (推荐): brew install blackhole-2ch\n"
+        "2. 打开「音频 MIDI 设置」\n"
+        "3. 创建「多输出设备」，包含扬声器和 BlackHole\n"
+        "4. 将多输出设备设为系统输出\n"
+        "5. 在本程序中选择 BlackHole 作为输入设备"
+    )
+else:
+    _MONITOR_FAILED_MSG = "无法启动音频监听，请检查音频设备选择。"
+    _START_FAILED_MSG = (
+        "无法启动声音检测。\n\n"
+        "请检查是否启用了「立体声混音」设备。"
+    )
+
+
+def _set_style_flag(widget: QWidget, name: str, value: bool) -> None:
+    """
+    切换控件的动态属性，由全局样式表中的属性选择器决定外观
+    只重新计算该控件的样式，不为单个控件编译样式表
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def _set_if_changed(label: QLabel, text: str) -> None:
+    """文本变化时才更新标签，避免无谓的重新布局和重绘"""
+    if label.text() != text:
+        label.setText(text)
+
 
 class SignalBridge(QObject):
     """信号桥接器，用于跨线程通信"""
-    state_changed = pyqtSignal(object)
-    stats_updated = pyqtSignal(object)
+    bot_updated = pyqtSignal(object, object)
     log_received = pyqtSignal(str)
+    calibrate_done = pyqtSignal()
+    # 请求在界面线程中启动补发定时器（参数为延迟毫秒数）
+    _flush_requested = pyqtSignal(int)
+    
+    # 状态未变化时两次通知的最小间隔（秒）
+    STATS_EMIT_INTERVAL = 0.1
+    
+    def __init__(self):
+        super().__init__()
+        self._last_emit_state = None
+        self._last_stats_emit = 0.0
+        # 节流期间最后一次被跳过的通知，间隔到期后补发，保证最终值总能显示
+        self._pending = None
+        self._lock = threading.Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        # 机器人线程发出的信号排队到界面线程，定时器只在界面线程中启动
+        self._flush_requested.connect(self._flush_timer.start)
+    
+    def emit_bot_update(self, state, stats) -> None:
+        """
+        转发机器人的状态与统计通知（在机器人线程中调用）
+        
+        状态变化总是立即发送；只有统计变化时限制为每 100ms 最多一次，
+        间隔内的通知只保留最后一次，间隔到期后补发
+        """
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last_stats_emit
+            throttled = state == self._last_emit_state and elapsed < self.STATS_EMIT_INTERVAL
+            if throttled:
+                schedule = self._pending is None
+                self._pending = (state, stats)
+            else:
+                # 立即发送的通知已包含最新数据，之前待补发的通知作废
+                self._pending = None
+                self._last_emit_state = state
+                self._last_stats_emit = now
+        
+        if not throttled:
+            self.bot_updated.emit(state, stats)
+        elif schedule:
+            delay = (self.STATS_EMIT_INTERVAL - elapsed) * 1000
+            self._flush_requested.emit(max(1, int(delay)))
+    
+    def _flush_pending(self) -> None:
+        """补发定时器回调（界面线程），发送节流期间保留的最后一次通知"""
+        with self._lock:
+            pending = self._pending
+            if pending is None:
+                return
+            self._pending = None
+            self._last_stats_emit = time.monotonic()
+        self.bot_updated.emit(*pending)
+
+
+class _CalibrateRunnable(QRunnable):
+    """在线程池中执行声音校准，完成后通过信号通知界面"""
+    
+    def __init__(self, bot: FishingBot, signals: SignalBridge, duration: float = 2.0):
+        super().__init__()
+        self._bot = bot
+        self._signals = signals
+        self._duration = duration
+    
+    def run(self) -> None:
+        self._bot.calibrate_sound(self._duration)
+        # 通过信号更新 UI
+        self._signals.log_received.emit("校准完成")
+        self._signals.calibrate_done.emit()
 
 
 class MainWindow(QMainWindow):
@@ -40,29 +268,44 @@ class MainWindow(QMainWindow):
         
         # 创建钓鱼机器人
         self._bot = FishingBot(self._config)
+        # 声音检测器在机器人生命周期内不变，缓存引用省去逐次属性链查找
+        self._sd = self._bot.sound_detector
+        self._last_state = FishingState.IDLE
+        # 波形图上次显示的阈值与噪音基准，变化时才推送
+        self._last_threshold = None
+        self._last_noise_floor = None
+        # 统计标签上次显示的数值，变化时才重新格式化
+        self._last_casts = -1
+        self._last_hooks = -1
+        self._last_rate_tenths = -1
+        self._last_baits = -1
+        # 上次应用到机器人的界面配置，未变化时跳过重新配置
+        self._last_config_tuple = None
         
         # 信号桥接
         self._signals = SignalBridge()
-        self._signals.state_changed.connect(self._on_state_changed)
-        self._signals.stats_updated.connect(self._on_stats_updated)
+        self._signals.bot_updated.connect(self._on_bot_updated)
         self._signals.log_received.connect(self._on_log_received)
+        self._signals.calibrate_done.connect(self._on_calibrate_done)
         
         # 设置回调
-        self._bot.set_state_callback(lambda s: self._signals.state_changed.emit(s))
-        self._bot.set_stats_callback(lambda s: self._signals.stats_updated.emit(s))
-        self._bot.set_log_callback(lambda s: self._signals.log_received.emit(s))
+        self._bot.set_combined_callback(self._signals.emit_bot_update)
+        self._bot.set_log_callback(self._signals.log_received.emit)
+        
+        # 待写入日志区的消息，由定时器批量刷新
+        self._log_queue = deque(maxlen=500)
+        self._log_flush_timer = QTimer()
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
         
         # 初始化 UI
         self._init_ui()
         
-        # 音量监控定时器
-        self._volume_timer = QTimer()
-        self._volume_timer.timeout.connect(self._update_volume_display)
-        
-        # 时间更新定时器
-        self._time_timer = QTimer()
-        self._time_timer.timeout.connect(self._update_time_display)
-        self._time_timer.start(1000)
+        # 波形图由声音检测器推送的音量信号驱动重绘
+        # 1 秒一次的界面定时器只负责运行时间和阈值同步，仅在监听音频或钓鱼运行期间启动
+        self._monitoring = False
+        self._ui_timer = QTimer()
+        self._ui_timer.timeout.connect(self._on_ui_tick)
     
     def _init_ui(self) -> None:
         """初始化界面"""
@@ -139,23 +382,28 @@ class MainWindow(QMainWindow):
         group = QGroupBox("音量波形图（用于调试）")
         layout = QVBoxLayout(group)
         
-        # 波形图控件
-        self._volume_graph = VolumeGraph(max_points=300)  # 约30秒数据
-        self._volume_graph.setMinimumHeight(150)
-        layout.addWidget(self._volume_graph)
+        # 波形图控件在首次需要时才创建，之前显示占位提示
+        self._volume_graph: Optional[VolumeGraph] = None
+        self._graph_stack = QStackedWidget()
+        self._graph_stack.setMinimumHeight(150)
+        placeholder = QLabel("点击「开始监听音频」显示波形")
+        placeholder.setObjectName("hintLabel")
+        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._graph_stack.addWidget(placeholder)
+        layout.addWidget(self._graph_stack)
         
         # 控制按钮行1
         btn_layout1 = QHBoxLayout()
         
         # 测试音频按钮（重要！）
         self._test_audio_btn = QPushButton("▶ 开始监听音频")
-        self._test_audio_btn.setStyleSheet("QPushButton { background-color: #2d5a27; }")
+        self._test_audio_btn.setObjectName("testAudioButton")
         self._test_audio_btn.clicked.connect(self._on_test_audio)
         btn_layout1.addWidget(self._test_audio_btn)
         
         # 清除按钮
         clear_btn = QPushButton("清除波形")
-        clear_btn.clicked.connect(self._volume_graph.clear)
+        clear_btn.clicked.connect(self._on_clear_graph)
         btn_layout1.addWidget(clear_btn)
         
         # 模拟触发按钮
@@ -180,7 +428,7 @@ class MainWindow(QMainWindow):
         
         # 自动缩放
         auto_scale_btn = QPushButton("自动缩放")
-        auto_scale_btn.clicked.connect(lambda: self._volume_graph.enable_auto_scale(True))
+        auto_scale_btn.clicked.connect(lambda: self._ensure_volume_graph().enable_auto_scale(True))
         btn_layout2.addWidget(auto_scale_btn)
         
         btn_layout2.addStretch()
@@ -190,51 +438,64 @@ class MainWindow(QMainWindow):
     
     def _on_test_audio(self) -> None:
         """测试音频按钮点击"""
-        if self._volume_timer.isActive():
+        if self._monitoring:
             # 停止监听
-            self._volume_timer.stop()
+            self._set_monitoring(False)
             if not self._bot.is_running:
-                self._bot.sound_detector.stop()
+                self._sd.stop()
             self._test_audio_btn.setText("▶ 开始监听音频")
-            self._test_audio_btn.setStyleSheet("QPushButton { background-color: #2d5a27; }")
-            self._log_text.append("音频监听已停止")
+            _set_style_flag(self._test_audio_btn, "active", False)
+            self._on_log_received("音频监听已停止")
         else:
             # 开始监听
             self._apply_config_to_bot()
             
             # 如果钓鱼没有运行，单独启动声音检测
             if not self._bot.is_running:
-                if not self._bot.sound_detector.start():
-                    if IS_MACOS:
-                        QMessageBox.warning(
-                            self, 
-                            "音频监听失败", 
-                            "无法启动音频监听。\n\n"
-                            "请确保已选择正确的音频设备。\n"
-                            "macOS 需要安装 BlackHole 等虚拟音频设备。"
-                        )
-                    else:
-                        QMessageBox.warning(
-                            self, 
-                            "音频监听失败", 
-                            "无法启动音频监听，请检查音频设备选择。"
-                        )
+                if not self._sd.start():
+                    QMessageBox.warning(self, "音频监听失败", _MONITOR_FAILED_MSG)
                     return
             
-            self._volume_timer.start(100)  # 每100ms更新一次
+            self._set_monitoring(True)
             self._test_audio_btn.setText("⏹ 停止监听")
-            self._test_audio_btn.setStyleSheet("QPushButton { background-color: #8b2500; }")
-            self._log_text.append("音频监听已开始，观察波形图...")
+            _set_style_flag(self._test_audio_btn, "active", True)
+            self._on_log_received("音频监听已开始，观察波形图...")
+    
+    def _ensure_volume_graph(self) -> VolumeGraph:
+        """
+        获取波形图控件，首次调用时创建
+        
+        Returns:
+            波形图控件
+        """
+        if self._volume_graph is None:
+            graph = VolumeGraph(max_points=300)  # 约30秒数据
+            # 直接读取声音检测器写入的音量历史
+            graph.set_history(self._sd.volume_history)
+            self._graph_stack.addWidget(graph)
+            self._graph_stack.setCurrentWidget(graph)
+            self._volume_graph = graph
+            # 新控件需要重新推送阈值与噪音基准
+            self._last_threshold = None
+            self._last_noise_floor = None
+            self._sync_graph_levels()
+        return self._volume_graph
+    
+    def _on_clear_graph(self) -> None:
+        """清除波形"""
+        if self._volume_graph is not None:
+            self._volume_graph.clear()
     
     def _test_trigger(self) -> None:
         """测试触发"""
-        self._volume_graph.mark_trigger()
-        self._log_text.append("[测试] 手动触发标记")
+        self._ensure_volume_graph().mark_trigger()
+        self._on_log_received("[测试] 手动触发标记")
     
     def _on_y_max_changed(self, value: int) -> None:
         """Y轴最大值变化"""
-        self._volume_graph.set_max_volume(value / 1000.0)
-        self._volume_graph.enable_auto_scale(False)
+        graph = self._ensure_volume_graph()
+        graph.set_max_volume(value / 1000.0)
+        graph.enable_auto_scale(False)
     
     def _create_hotkey_group(self) -> QGroupBox:
         """创建快捷键设置组"""
@@ -264,7 +525,7 @@ class MainWindow(QMainWindow):
         
         # 提示
         hint = QLabel("提示: 支持单字符 (如 1, f) 或特殊键 (如 f1, space)")
-        hint.setStyleSheet("color: gray; font-size: 11px;")
+        hint.setObjectName("hintLabel")
         layout.addWidget(hint, 2, 0, 1, 4)
         
         return group
@@ -283,7 +544,7 @@ class MainWindow(QMainWindow):
         
         # 刷新设备按钮
         refresh_btn = QPushButton("刷新")
-        refresh_btn.clicked.connect(self._refresh_audio_devices)
+        refresh_btn.clicked.connect(lambda: self._refresh_audio_devices(force=True))
         layout.addWidget(refresh_btn, 0, 3)
         
         # 声音灵敏度
@@ -292,6 +553,7 @@ class MainWindow(QMainWindow):
         self._sensitivity_slider.setRange(0, 100)
         self._sensitivity_slider.setValue(self._config.sound_sensitivity)
         self._sensitivity_slider.valueChanged.connect(self._on_sensitivity_changed)
+        self._sensitivity_slider.sliderReleased.connect(self._apply_sensitivity)
         layout.addWidget(self._sensitivity_slider, 1, 1)
         self._sensitivity_label = QLabel(f"{self._config.sound_sensitivity}%")
         self._sensitivity_label.setMinimumWidth(40)
@@ -347,36 +609,46 @@ class MainWindow(QMainWindow):
         # macOS 提示
         if IS_MACOS:
             hint = QLabel("提示: macOS 需要安装 BlackHole 并配置多输出设备来捕获游戏声音")
-            hint.setStyleSheet("color: #f0ad4e; font-size: 11px;")
+            hint.setObjectName("warningHintLabel")
             hint.setWordWrap(True)
             layout.addWidget(hint, 4, 0, 1, 4)
         
         return group
     
-    def _refresh_audio_devices(self) -> None:
-        """刷新音频设备列表"""
-        self._device_combo.clear()
+    def _refresh_audio_devices(self, force: bool = False) -> None:
+        """
+        刷新音频设备列表
+        
+        Args:
+            force: 是否忽略枚举缓存重新扫描设备（点击刷新按钮时）
+        """
+        if force:
+            SoundDetector.invalidate_device_cache()
         
         devices = SoundDetector.get_audio_devices()
         recommended_idx, _ = SoundDetector.get_recommended_device()
         
-        selected_index = 0
-        for i, device in enumerate(devices):
-            # 标记推荐设备和虚拟设备
-            name = device['name']
-            if device.get('is_virtual'):
-                name = f"★ {name}"
-            
-            self._device_combo.addItem(name, device['index'])
-            
-            # 选中推荐设备
-            if device['index'] == recommended_idx:
-                selected_index = i
-        
-        if devices:
-            self._device_combo.setCurrentIndex(selected_index)
-        else:
-            self._device_combo.addItem("未找到音频设备", None)
+        # 标记虚拟设备
+        names = ["★ " + d['name'] if d.get('is_virtual') else d['name'] for d in devices]
+        
+        # 批量填充期间屏蔽信号，避免逐项触发 currentIndexChanged
+        combo = self._device_combo
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            if devices:
+                combo.addItems(names)
+                selected_index = 0
+                for i, device in enumerate(devices):
+                    combo.setItemData(i, device['index'])
+                    # 选中推荐设备
+                    if device['index'] == recommended_idx:
+                        selected_index = i
+                combo.setCurrentIndex(selected_index)
+            else:
+                combo.addItem("未找到音频设备", None)
+        finally:
+            combo.blockSignals(False)
     
     def _create_control_group(self) -> QGroupBox:
         """创建控制按钮组"""
@@ -407,9 +679,11 @@ class MainWindow(QMainWindow):
         group = QGroupBox("日志")
         layout = QVBoxLayout(group)
         
-        self._log_text = QTextEdit()
+        self._log_text = QPlainTextEdit()
         self._log_text.setReadOnly(True)
         self._log_text.setMaximumHeight(150)
+        # 超出行数时自动丢弃最早的日志
+        self._log_text.setMaximumBlockCount(2000)
         layout.addWidget(self._log_text)
         
         # 清除按钮
@@ -421,155 +695,74 @@ class MainWindow(QMainWindow):
     
     def _apply_styles(self) -> None:
         """应用样式"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: #e0e0e0;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLabel {
-                color: #e0e0e0;
-            }
-            QLineEdit, QSpinBox {
-                background-color: #3c3c3c;
-                border: 1px solid #4a4a4a;
-                border-radius: 3px;
-                padding: 5px;
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #4a4a4a;
-                border: 1px solid #5a5a5a;
-                border-radius: 5px;
-                padding: 8px 15px;
-                color: #e0e0e0;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-            QPushButton#startButton {
-                background-color: #2d5a27;
-                border-color: #3d7a37;
-            }
-            QPushButton#startButton:hover {
-                background-color: #3d7a37;
-            }
-            QTextEdit {
-                background-color: #1e1e1e;
-                border: 1px solid #3c3c3c;
-                border-radius: 3px;
-                color: #b0b0b0;
-                font-family: Consolas, monospace;
-            }
-            QSlider::groove:horizontal {
-                height: 8px;
-                background: #3c3c3c;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                width: 16px;
-                margin: -4px 0;
-                background: #5a9bd5;
-                border-radius: 8px;
-            }
-            QProgressBar {
-                border: 1px solid #3c3c3c;
-                border-radius: 3px;
-                background-color: #2b2b2b;
-            }
-            QProgressBar::chunk {
-                background-color: #5a9bd5;
-                border-radius: 2px;
-            }
-            QLabel#statusLabel {
-                font-weight: bold;
-                color: #5a9bd5;
-            }
-        """)
+        self.setStyleSheet(_MAIN_QSS)
     
     def _apply_config_to_bot(self) -> None:
-        """应用界面配置到机器人"""
-        self._config.pre_action_key = self._pre_action_input.text() or "1"
-        self._config.fishing_key = self._fishing_input.text() or "2"
-        self._config.interact_key = self._interact_input.text() or "f"
-        self._config.bait_interval = self._bait_interval_spin.value() * 60
-        self._config.timeout = self._timeout_spin.value()
-        self._config.sound_sensitivity = self._sensitivity_slider.value()
-        self._config.hook_delay_min = self._hook_delay_min.value()
-        self._config.hook_delay_max = self._hook_delay_max.value()
-        self._config.cast_delay_min = self._cast_delay_min.value()
-        self._config.cast_delay_max = self._cast_delay_max.value()
+        """应用界面配置到机器人，界面值与上次相同时直接返回"""
+        values = (
+            self._pre_action_input.text() or "1",
+            self._fishing_input.text() or "2",
+            self._interact_input.text() or "f",
+            self._bait_interval_spin.value() * 60,
+            self._timeout_spin.value(),
+            self._sensitivity_slider.value(),
+            self._hook_delay_min.value(),
+            self._hook_delay_max.value(),
+            self._cast_delay_min.value(),
+            self._cast_delay_max.value(),
+            self._device_combo.currentData(),
+            self._device_combo.currentText(),
+        )
+        if values == self._last_config_tuple:
+            return
+        self._last_config_tuple = values
+        
+        (
+            self._config.pre_action_key,
+            self._config.fishing_key,
+            self._config.interact_key,
+            self._config.bait_interval,
+            self._config.timeout,
+            self._config.sound_sensitivity,
+            self._config.hook_delay_min,
+            self._config.hook_delay_max,
+            self._config.cast_delay_min,
+            self._config.cast_delay_max,
+            device_index,
+            device_name,
+        ) = values
         
         # 设置音频设备
-        device_index = self._device_combo.currentData()
-        device_name = self._device_combo.currentText()
-        self._bot.sound_detector.set_device(device_index, device_name)
+        self._sd.set_device(device_index, device_name)
         
         self._bot.set_config(self._config)
+        self._sync_graph_levels()
     
     def _on_start_stop(self) -> None:
         """开始/停止按钮点击"""
         if self._bot.is_running:
+            # 停止前刷新一次，保留最终运行时间
+            self._update_time_display()
             self._bot.stop()
             self._start_btn.setText("开始钓鱼")
-            self._start_btn.setStyleSheet("")
+            _set_style_flag(self._start_btn, "running", False)
             self._pause_btn.setEnabled(False)
             # 停止钓鱼时也停止音频监听和波形显示
-            self._volume_timer.stop()
+            self._set_monitoring(False)
             self._test_audio_btn.setText("▶ 开始监听音频")
-            self._test_audio_btn.setStyleSheet("QPushButton { background-color: #2d5a27; }")
+            _set_style_flag(self._test_audio_btn, "active", False)
         else:
             self._apply_config_to_bot()
             if self._bot.start():
                 self._start_btn.setText("停止")
-                self._start_btn.setStyleSheet("""
-                    QPushButton#startButton {
-                        background-color: #8b2500;
-                        border-color: #a03000;
-                    }
-                    QPushButton#startButton:hover {
-                        background-color: #a03000;
-                    }
-                """)
+                _set_style_flag(self._start_btn, "running", True)
                 self._pause_btn.setEnabled(True)
-                self._volume_timer.start(100)
+                self._set_monitoring(True)
                 # 更新测试音频按钮状态
                 self._test_audio_btn.setText("⏹ 停止监听")
-                self._test_audio_btn.setStyleSheet("QPushButton { background-color: #8b2500; }")
+                _set_style_flag(self._test_audio_btn, "active", True)
             else:
-                if IS_MACOS:
-                    QMessageBox.warning(
-                        self, 
-                        "启动失败", 
-                        "无法启动声音检测。\n\n"
-                        "macOS 需要安装虚拟音频设备来捕获系统声音：\n"
-                        "1. 安装 BlackHole (推荐): brew install blackhole-2ch\n"
-                        "2. 打开「音频 MIDI 设置」\n"
-                        "3. 创建「多输出设备」，包含扬声器和 BlackHole\n"
-                        "4. 将多输出设备设为系统输出\n"
-                        "5. 在本程序中选择 BlackHole 作为输入设备"
-                    )
-                else:
-                    QMessageBox.warning(
-                        self, 
-                        "启动失败", 
-                        "无法启动声音检测。\n\n"
-                        "请检查是否启用了「立体声混音」设备。"
-                    )
+                QMessageBox.warning(self, "启动失败", _START_FAILED_MSG)
     
     def _on_pause(self) -> None:
         """暂停按钮点击"""
@@ -583,75 +776,136 @@ class MainWindow(QMainWindow):
         """保存配置按钮点击"""
         self._apply_config_to_bot()
         if self._config.save():
-            self._log_text.append("配置已保存")
+            self._on_log_received("配置已保存")
         else:
             QMessageBox.warning(self, "错误", "配置保存失败")
     
     def _on_sensitivity_changed(self, value: int) -> None:
-        """灵敏度滑块变化"""
+        """灵敏度滑块变化，拖动过程中只更新标签，松开后再应用"""
         self._sensitivity_label.setText(f"{value}%")
-        self._config.sound_sensitivity = value
+        # 键盘或点击轨道等非拖动操作没有松开事件，直接应用
+        if not self._sensitivity_slider.isSliderDown():
+            self._apply_sensitivity()
+    
+    def _apply_sensitivity(self) -> None:
+        """将滑块灵敏度应用到配置和声音检测器"""
+        self._config.sound_sensitivity = self._sensitivity_slider.value()
         self._config.calculate_threshold_from_sensitivity()
-        self._bot.sound_detector.threshold = self._config.sound_threshold
+        self._sd.threshold = self._config.sound_threshold
+        self._sync_graph_levels()
     
     def _on_calibrate(self) -> None:
         """校准按钮点击"""
         self._calibrate_btn.setEnabled(False)
         self._calibrate_btn.setText("校准中...")
         
-        # 在后台线程中执行校准
-        import threading
-        def calibrate():
-            self._bot.calibrate_sound(2.0)
-            # 通过信号更新 UI
-            self._signals.log_received.emit("校准完成")
-        
-        threading.Thread(target=calibrate, daemon=True).start()
-        
-        # 2秒后恢复按钮
-        QTimer.singleShot(2500, lambda: (
-            self._calibrate_btn.setEnabled(True),
-            self._calibrate_btn.setText("校准")
-        ))
+        # 在线程池中执行校准，完成后由 calibrate_done 信号恢复按钮
+        QThreadPool.globalInstance().start(_CalibrateRunnable(self._bot, self._signals, 2.0))
+    
+    def _on_calibrate_done(self) -> None:
+        """校准完成回调"""
+        self._calibrate_btn.setEnabled(True)
+        self._calibrate_btn.setText("校准")
+        self._sync_graph_levels()
+    
+    def _on_bot_updated(self, state: FishingState, stats: FishingStats) -> None:
+        """状态与统计合并回调"""
+        if state != self._last_state:
+            self._last_state = state
+            self._on_state_changed(state)
+        self._on_stats_updated(stats)
     
     def _on_state_changed(self, state: FishingState) -> None:
         """状态变化回调"""
-        state_names = {
-            FishingState.IDLE: "空闲",
-            FishingState.PRE_ACTION: "上饵中",
-            FishingState.CASTING: "抛竿中",
-            FishingState.WAITING: "等待上钩",
-            FishingState.HOOKING: "收杆中",
-            FishingState.PAUSED: "已暂停",
-        }
-        self._status_label.setText(state_names.get(state, "未知"))
+        _set_if_changed(self._status_label, _STATE_NAMES.get(state, "未知"))
         
         # 当检测到声音进入 HOOKING 状态时，在波形图上标记
-        if state == FishingState.HOOKING:
+        if state == FishingState.HOOKING and self._volume_graph is not None:
             self._volume_graph.mark_trigger()
     
     def _on_stats_updated(self, stats: FishingStats) -> None:
-        """统计更新回调"""
-        self._cast_label.setText(str(stats.total_casts))
-        self._success_label.setText(str(stats.successful_hooks))
-        self._rate_label.setText(f"{stats.success_rate:.1f}%")
-        self._bait_label.setText(str(stats.baits_applied))
+        """统计更新回调，只在数值变化时格式化并更新标签"""
+        casts = stats.total_casts
+        if casts != self._last_casts:
+            self._last_casts = casts
+            self._cast_label.setText(str(casts))
+        
+        hooks = stats.successful_hooks
+        if hooks != self._last_hooks:
+            self._last_hooks = hooks
+            self._success_label.setText(str(hooks))
+        
+        # 成功率按显示精度（0.1%）比较
+        rate_tenths = round(stats.success_rate * 10)
+        if rate_tenths != self._last_rate_tenths:
+            self._last_rate_tenths = rate_tenths
+            self._rate_label.setText(f"{rate_tenths / 10:.1f}%")
+        
+        baits = stats.baits_applied
+        if baits != self._last_baits:
+            self._last_baits = baits
+            self._bait_label.setText(str(baits))
     
     def _on_log_received(self, message: str) -> None:
-        """日志接收回调"""
-        self._log_text.append(message)
-        # 滚动到底部
-        scrollbar = self._log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        """日志接收回调，消息先入队，100ms 内合并为一次写入"""
+        self._log_queue.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start(100)
     
-    def _update_volume_display(self) -> None:
-        """更新音量显示"""
-        volume = self._bot.sound_detector.current_volume
-        
-        # 更新波形图
-        self._volume_graph.add_volume(volume)
-        self._volume_graph.set_threshold(self._config.sound_threshold)
-        self._volume_graph.set_noise_floor(self._bot.sound_detector._noise_floor)
+    def _flush_logs(self) -> None:
+        """将排队的日志一次性写入日志区"""
+        if not self._log_queue:
+            return
+        text = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        # 视图位于底部时 appendPlainText 会自动跟随到底部，无需手动读取滚动条范围
+        self._log_text.appendPlainText(text)
+    
+    def _set_monitoring(self, enabled: bool) -> None:
+        """
+        切换波形显示，并按需启动或停止界面刷新定时器
+        
+        Args:
+            enabled: 是否显示实时波形
+        """
+        self._monitoring = enabled
+        if enabled:
+            # 音频线程只写入环形缓冲区，由波形图定时器轮询新数据
+            self._ensure_volume_graph().set_polling(True)
+        elif self._volume_graph is not None:
+            self._volume_graph.set_polling(False)
+        self._update_ui_timer()
+    
+    def _update_ui_timer(self) -> None:
+        """监听音频或钓鱼运行时保持定时器运行，否则停止"""
+        if self._monitoring or self._bot.is_running:
+            if not self._ui_timer.isActive():
+                self._ui_timer.start(1000)
+        else:
+            self._ui_timer.stop()
+    
+    def _on_ui_tick(self) -> None:
+        """界面定时器回调（每秒一次）"""
+        self._update_time_display()
+        self._sync_graph_levels()
+        # 机器人自行停止且未在监听时停止定时器
+        if not self._monitoring:
+            self._update_ui_timer()
+    
+    def _sync_graph_levels(self) -> None:
+        """阈值或噪音基准变化时才推送到波形图"""
+        if self._volume_graph is None:
+            return
+        
+        threshold = self._config.sound_threshold
+        if threshold != self._last_threshold:
+            self._last_threshold = threshold
+            self._volume_graph.set_threshold(threshold)
+        
+        noise_floor = self._sd.noise_floor
+        if noise_floor != self._last_noise_floor:
+            self._last_noise_floor = noise_floor
+            self._volume_graph.set_noise_floor(noise_floor)
     
     def _update_time_display(self) -> None:
         """更新运行时间显示"""
@@ -660,10 +914,10 @@ class MainWindow(QMainWindow):
             hours = seconds // 3600
             minutes = (seconds % 3600) // 60
             secs = seconds % 60
-            self._time_label.setText(f"{hours:02d}:{minutes:02d}:{secs:02d}")
+            _set_if_changed(self._time_label, f"{hours:02d}:{minutes:02d}:{secs:02d}")
     
     def closeEvent(self, event) -> None:
         """窗口关闭事件"""
-        if self._bot.is_running:
-            self._bot.stop()
+        self._ui_timer.stop()
+        self._bot.shutdown()
         event.accept()
@@ -2,15 +2,49 @@
 实时音量波形图组件
 """
 
-from collections import deque
+import math
+from typing import Optional
+
+import numpy as np
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont
+from PyQt6.QtCore import Qt, QTimer, QLine, QRect
+from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QPolygon, QPixmap
+
+from ..core.sound_detector import VolumeHistory
+
+
+def _nice_ceiling(value: float) -> float:
+    """
+    向上取整到 1/2/5 × 10^n 刻度
+    
+    Args:
+        value: 正数
+        
+    Returns:
+        不小于 value 的最小刻度值
+    """
+    base = 10.0 ** math.floor(math.log10(value))
+    for step in (1, 2, 5):
+        if step * base >= value:
+            return step * base
+    return 10 * base
 
 
 class VolumeGraph(QWidget):
     """实时音量波形图"""
     
+    # 绘图区边距
+    MARGIN_LEFT = 50
+    MARGIN_RIGHT = 10
+    MARGIN_TOP = 10
+    MARGIN_BOTTOM = 25
+    # 波形缓冲四周留出的边距，避免线宽被裁掉
+    WAVE_PAD = 2
+    # 自动缩放的Y轴最小量程
+    MIN_AUTO_SCALE = 0.1
+    # 最多保留的触发标记数
+    MAX_TRIGGERS = 50
+    
     def __init__(self, parent=None, max_points: int = 300):
         """
         初始化波形图
@@ -21,18 +55,20 @@ class VolumeGraph(QWidget):
         """
         super().__init__(parent)
         
-        # 数据存储
+        # 数据存储，可通过 set_history 直接共享声音检测器的环形缓冲区
         self._max_points = max_points
-        self._volumes = deque(maxlen=max_points)
+        self._history = VolumeHistory(max_points)
         self._threshold = 0.02
         self._noise_floor = 0.0
         
         # 显示设置
-        self._max_volume = 0.1  # Y轴最大值，会自动调整
+        self._max_volume = self.MIN_AUTO_SCALE  # Y轴最大值，会自动调整
         self._auto_scale = True
+        # 自动缩放的连续量程，按刻度取整后作为Y轴最大值
+        self._scale_level = self.MIN_AUTO_SCALE
         
         # 触发标记
-        self._trigger_points = deque(maxlen=50)  # 记录触发时刻的索引
+        self._trigger_points = np.empty(0, dtype=np.int64)  # 记录触发时刻的累计点数
         
         # 颜色
         self._bg_color = QColor(30, 30, 30)
@@ -43,76 +79,373 @@ class VolumeGraph(QWidget):
         self._trigger_color = QColor(255, 200, 0)
         self._text_color = QColor(180, 180, 180)
         
+        # 画笔与字体只创建一次，绘制时直接复用
+        self._pen_grid = QPen(self._grid_color, 1)
+        self._pen_text = QPen(self._text_color, 1)
+        self._pen_line = QPen(self._line_color, 1.5)
+        self._pen_threshold = QPen(self._threshold_color, 2, Qt.PenStyle.DashLine)
+        self._pen_noise = QPen(self._noise_color, 1, Qt.PenStyle.DotLine)
+        self._pen_trigger = QPen(self._trigger_color, 2)
+        self._pen_legend_line = QPen(self._line_color, 2)
+        self._pen_legend_threshold = QPen(self._threshold_color, 2)
+        self._font = QFont("Arial", 8)
+        
+        # 重绘合并：数据变化只置脏标记，由定时器按约 30 FPS 统一刷新
+        # 定时器在有新数据时启动，一个周期内没有新数据就停止，空闲时不占用界面线程
+        # 轮询模式下定时器持续运行，比较环形缓冲区的累计计数判断是否有新数据
+        self._dirty = False
+        self._polling = False
+        self._polled_count = 0
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setInterval(33)
+        self._repaint_timer.timeout.connect(self._maybe_update)
+        # 设置类调用在下一轮事件循环合并刷新，无需等待定时器
+        self._update_scheduled = False
+        
+        # 波形后备缓冲：新数据到达时左移已绘制内容，只补画新增的线段
+        self._wave_pixmap: Optional[QPixmap] = None
+        self._wave_count = 0          # 缓冲中已绘制到的累计点数
+        self._wave_max_volume = 0.0   # 绘制缓冲时使用的Y轴最大值
+        self._wave_scroll = 0.0       # 未满一个像素的滚动量，累积到下一次
+        # 数据点横坐标缓存，键为 (点数, 绘图区宽度, 边距)
+        self._xs = np.empty(0, dtype=np.int32)
+        self._xs_key: tuple = ()
+        
+        # 静态图层缓存（背景、网格、Y轴标签、底部标签、图例）
+        self._static_layer: Optional[QPixmap] = None
+        self._static_max_volume = 0.0  # 绘制静态图层时使用的Y轴最大值
+        
+        # 阈值文字只在有效阈值变化时重新格式化
+        self._threshold_text = ""
+        self._threshold_text_key = -1.0
+        
         # 设置最小尺寸
         self.setMinimumSize(400, 150)
+    
+    def set_history(self, history: VolumeHistory) -> None:
+        """
+        设置数据来源
         
-        # 初始化数据
-        for _ in range(max_points):
-            self._volumes.append(0)
+        Args:
+            history: 音量历史环形缓冲区，由声音检测器在音频线程中写入
+        """
+        self._history = history
+        self._max_points = history.size
+        self._trigger_points = self._trigger_points[:0]
+        self._wave_pixmap = None
+        self._mark_dirty()
     
     def set_threshold(self, threshold: float) -> None:
         """设置阈值"""
         self._threshold = threshold
-        self.update()
+        self._schedule_update()
     
     def set_noise_floor(self, noise_floor: float) -> None:
         """设置噪音基准"""
         self._noise_floor = noise_floor
-        self.update()
+        self._schedule_update()
     
     def add_volume(self, volume: float) -> None:
         """添加音量数据点"""
-        self._volumes.append(volume)
-        
-        # 自动调整Y轴范围
-        if self._auto_scale and volume > self._max_volume * 0.8:
-            self._max_volume = volume * 1.5
-        
-        self.update()
+        self._history.push(volume)
+        self._mark_dirty()
     
     def mark_trigger(self) -> None:
         """标记触发点"""
-        self._trigger_points.append(len(self._volumes) - 1)
+        # 触发频率很低，直接重建数组即可
+        self._trigger_points = np.append(
+            self._trigger_points[-(self.MAX_TRIGGERS - 1):], self._history.count - 1
+        )
+        self._mark_dirty()
+    
+    def set_polling(self, enabled: bool) -> None:
+        """
+        启用/禁用轮询数据来源
+        
+        数据来源在其他线程写入时使用，由刷新定时器检查累计计数，
+        写入方无需跨线程通知界面
+        
+        Args:
+            enabled: 是否轮询
+        """
+        self._polling = enabled
+        if enabled:
+            self._polled_count = -1
+            if self.isVisible():
+                self._repaint_timer.start()
+    
+    def _mark_dirty(self) -> None:
+        """置脏标记，控件可见且定时器未运行时启动定时器"""
+        self._dirty = True
+        if not self._repaint_timer.isActive() and self.isVisible():
+            self._repaint_timer.start()
+    
+    def _schedule_update(self) -> None:
+        """置脏标记并在下一轮事件循环刷新，同一轮内的多次调用只刷新一次"""
+        self._dirty = True
+        if not self._update_scheduled:
+            self._update_scheduled = True
+            QTimer.singleShot(0, self._flush_update)
+    
+    def _flush_update(self) -> None:
+        """合并刷新回调，若定时器已先行刷新则什么也不做"""
+        self._update_scheduled = False
+        self._maybe_update()
+    
+    def _maybe_update(self) -> None:
+        """
+        定时器回调，有新数据时才触发重绘
+        
+        Y轴范围不变时静态图层无需重绘，只刷新绘图区及其上方的文字区域
+        """
+        if self._polling:
+            count = self._history.count
+            if count != self._polled_count:
+                self._polled_count = count
+                self._dirty = True
+        if not self._dirty:
+            # 上一个周期内没有新数据，非轮询时停止定时器直到下次置脏
+            if not self._polling:
+                self._repaint_timer.stop()
+            return
+        self._dirty = False
+        
+        # 自动调整Y轴范围：峰值接近上限时立即放大，之后随峰值回落缓慢收缩
+        if self._auto_scale:
+            target = self._history.peak() * 1.5
+            if target > self._max_volume * 1.2:
+                self._scale_level = target
+            else:
+                self._scale_level = max(self.MIN_AUTO_SCALE,
+                                        self._scale_level * 0.98 + target * 0.02)
+            # 取整到刻度，量程小幅波动时不会重绘静态图层
+            self._max_volume = _nice_ceiling(self._scale_level)
+        
+        if self._static_layer is None or self._static_max_volume != self._max_volume:
+            self.update()
+            return
+        
+        # 左侧Y轴标签和底部图例属于静态图层，不在刷新范围内
+        pad = self.WAVE_PAD
+        left = self.MARGIN_LEFT - pad
+        self.update(QRect(left, 0, self.width() - left,
+                          self.height() - self.MARGIN_BOTTOM + pad + 1))
     
     def clear(self) -> None:
         """清空数据"""
-        self._volumes.clear()
-        self._trigger_points.clear()
-        for _ in range(self._max_points):
-            self._volumes.append(0)
-        self._max_volume = 0.1
-        self.update()
+        self._history.clear()
+        self._trigger_points = self._trigger_points[:0]
+        self._max_volume = self.MIN_AUTO_SCALE
+        self._scale_level = self.MIN_AUTO_SCALE
+        self._wave_pixmap = None
+        self._schedule_update()
     
     def set_max_volume(self, max_vol: float) -> None:
         """手动设置Y轴最大值"""
         self._max_volume = max_vol
+        self._scale_level = max_vol
         self._auto_scale = False
-        self.update()
+        self._schedule_update()
     
     def enable_auto_scale(self, enabled: bool = True) -> None:
         """启用/禁用自动缩放"""
         self._auto_scale = enabled
+        self._schedule_update()
     
-    def paintEvent(self, event) -> None:
-        """绘制事件"""
-        painter = QPainter(self)
+    def showEvent(self, event) -> None:
+        """显示时若有未绘制的数据或处于轮询模式则启动刷新定时器"""
+        super().showEvent(event)
+        if self._dirty or self._polling:
+            self._repaint_timer.start()
+    
+    def hideEvent(self, event) -> None:
+        """隐藏时停止刷新定时器，避免后台空转"""
+        super().hideEvent(event)
+        self._repaint_timer.stop()
+    
+    def resizeEvent(self, event) -> None:
+        """尺寸变化后波形缓冲和静态图层需要整体重绘"""
+        super().resizeEvent(event)
+        self._wave_pixmap = None
+        self._static_layer = None
+    
+    def _x_coords(self, points_count: int, graph_width: int, pad: int) -> np.ndarray:
+        """
+        获取各数据点在波形缓冲中的横坐标，只在绘图区宽度或点数变化时重新计算
+        
+        Args:
+            points_count: 窗口内的数据点数
+            graph_width: 绘图区宽度
+            pad: 缓冲四周留出的边距
+            
+        Returns:
+            int32 横坐标数组
+        """
+        key = (points_count, graph_width, pad)
+        if key != self._xs_key:
+            x_step = graph_width / (points_count - 1)
+            self._xs = (pad + np.arange(points_count) * x_step).astype(np.int32)
+            self._xs_key = key
+        return self._xs
+    
+    def _wave_polygon(self, volumes: np.ndarray, xs: np.ndarray,
+                      graph_height: int, pad: int) -> QPolygon:
+        """
+        将音量数据映射为波形缓冲中的折线
+        
+        Args:
+            volumes: 从旧到新的音量数组
+            xs: 对应数据点的横坐标
+            graph_height: 绘图区高度
+            pad: 缓冲四周留出的边距，避免线宽被裁掉
+            
+        Returns:
+            折线顶点
+        """
+        max_volume = self._max_volume
+        # 纵坐标整体用 NumPy 计算，音量值限制在显示范围内
+        clamped = np.minimum(volumes, max_volume)
+        coords = np.empty((len(volumes), 2), dtype=np.int32)
+        coords[:, 0] = xs
+        coords[:, 1] = pad + graph_height * (1.0 - clamped / max_volume)
+        
+        # 水平连续段只保留两端点：同一像素上的重复点、开头未写入的零值都会被合并
+        ys = coords[:, 1]
+        if len(ys) > 2:
+            keep = np.ones(len(ys), dtype=bool)
+            keep[1:-1] = (ys[1:-1] != ys[:-2]) | (ys[1:-1] != ys[2:])
+            coords = coords[keep]
+        
+        polygon = QPolygon()
+        polygon.setPoints(*coords.ravel().tolist())
+        return polygon
+    
+    def _decimated_polygon(self, volumes: np.ndarray, graph_width: int,
+                           graph_height: int, pad: int) -> QPolygon:
+        """
+        按像素列抽取最小/最大值生成折线，绘制量只与绘图区宽度有关且不丢失峰值
+        
+        Args:
+            volumes: 从旧到新的音量数组，长度需大于像素列数
+            graph_width: 绘图区宽度
+            graph_height: 绘图区高度
+            pad: 缓冲四周留出的边距
+            
+        Returns:
+            每列依次连接最小值和最大值的折线顶点
+        """
+        columns = graph_width + 1
+        starts = (np.arange(columns) * len(volumes)) // columns
+        mins = np.minimum.reduceat(volumes, starts)
+        maxs = np.maximum.reduceat(volumes, starts)
+        
+        max_volume = self._max_volume
+        coords = np.empty((columns, 2, 2), dtype=np.int32)
+        coords[:, :, 0] = (pad + np.arange(columns))[:, None]
+        coords[:, 0, 1] = pad + graph_height * (1.0 - np.minimum(mins, max_volume) / max_volume)
+        coords[:, 1, 1] = pad + graph_height * (1.0 - np.minimum(maxs, max_volume) / max_volume)
+        
+        polygon = QPolygon()
+        polygon.setPoints(*coords.ravel().tolist())
+        return polygon
+    
+    def _render_wave(self, volumes: np.ndarray, count: int,
+                     graph_width: int, graph_height: int, pad: int) -> QPixmap:
+        """
+        更新波形缓冲
+        
+        Y轴范围不变时左移已有内容并只补画新增线段，否则整体重绘
+        
+        Args:
+            volumes: 从旧到新的音量数组
+            count: 累计写入点数
+            graph_width: 绘图区宽度
+            graph_height: 绘图区高度
+            pad: 缓冲四周留出的边距
+            
+        Returns:
+            波形缓冲，原点对应绘图区左上角向外偏移 pad
+        """
+        points_count = len(volumes)
+        x_step = graph_width / (points_count - 1)
+        new_points = count - self._wave_count
+        pixmap = self._wave_pixmap
+        # 数据点多于像素列时按列抽取最小/最大值，每次整体重绘
+        decimate = points_count - 1 > graph_width
+        
+        if (pixmap is None or decimate or self._wave_max_volume != self._max_volume
+                or not 0 <= new_points < points_count - 1):
+            # 整体重绘
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(int((graph_width + 2 * pad) * ratio),
+                             int((graph_height + 2 * pad) * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            first = 0
+            self._wave_pixmap = pixmap
+            self._wave_max_volume = self._max_volume
+            self._wave_scroll = 0.0
+        elif new_points:
+            # 按设备像素左移，不足一像素的部分留到下次
+            ratio = pixmap.devicePixelRatio()
+            self._wave_scroll += new_points * x_step * ratio
+            shift = int(self._wave_scroll)
+            self._wave_scroll -= shift
+            pixmap.scroll(-shift, 0, pixmap.rect())
+            first = points_count - 1 - new_points
+        else:
+            return pixmap
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if first:
+            # 清掉滚动后右侧露出的残留像素，再从上一个末尾点接着画
+            clear_x = pad + first * x_step + 1
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(int(clear_x), 0, pixmap.width(), pixmap.height(),
+                             Qt.GlobalColor.transparent)
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setPen(self._pen_line)
+        # 所有点一次性交给 drawPolyline 绘制，避免逐段调用 drawLine
+        if decimate:
+            polygon = self._decimated_polygon(volumes, graph_width, graph_height, pad)
+        else:
+            xs = self._x_coords(points_count, graph_width, pad)
+            polygon = self._wave_polygon(volumes[first:], xs[first:], graph_height, pad)
+        painter.drawPolyline(polygon)
+        painter.end()
         
-        width = self.width()
-        height = self.height()
-        margin_left = 50
-        margin_right = 10
-        margin_top = 10
-        margin_bottom = 25
+        self._wave_count = count
+        return pixmap
+    
+    def _render_static(self, width: int, height: int, graph_height: int) -> QPixmap:
+        """
+        绘制静态图层
         
-        graph_width = width - margin_left - margin_right
-        graph_height = height - margin_top - margin_bottom
+        Args:
+            width: 控件宽度
+            height: 控件高度
+            graph_height: 绘图区高度
+            
+        Returns:
+            包含背景、网格、Y轴标签、底部标签和图例的图层
+        """
+        margin_left = self.MARGIN_LEFT
+        margin_right = self.MARGIN_RIGHT
+        margin_top = self.MARGIN_TOP
+        
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(width * ratio), int(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # 背景
         painter.fillRect(0, 0, width, height, self._bg_color)
         
         # 绘制网格
-        painter.setPen(QPen(self._grid_color, 1))
+        painter.setPen(self._pen_grid)
         
         # 横向网格线（5条）
         for i in range(6):
@@ -120,86 +453,100 @@ class VolumeGraph(QWidget):
             painter.drawLine(margin_left, y, width - margin_right, y)
         
         # Y轴标签
-        painter.setPen(QPen(self._text_color, 1))
-        font = QFont("Arial", 8)
-        painter.setFont(font)
+        painter.setPen(self._pen_text)
+        painter.setFont(self._font)
         
         for i in range(6):
             y = margin_top + int(graph_height * i / 5)
             value = self._max_volume * (5 - i) / 5
             painter.drawText(5, y + 4, f"{value:.3f}")
         
-        # 有效阈值线（阈值 + 噪音基准）
-        effective_threshold = self._threshold + self._noise_floor
-        if effective_threshold < self._max_volume:
-            threshold_y = margin_top + int(graph_height * (1 - effective_threshold / self._max_volume))
-            painter.setPen(QPen(self._threshold_color, 2, Qt.PenStyle.DashLine))
-            painter.drawLine(margin_left, threshold_y, width - margin_right, threshold_y)
-            painter.drawText(margin_left + 5, threshold_y - 5, f"阈值: {effective_threshold:.4f}")
-        
-        # 噪音基准线
-        if self._noise_floor > 0 and self._noise_floor < self._max_volume:
-            noise_y = margin_top + int(graph_height * (1 - self._noise_floor / self._max_volume))
-            painter.setPen(QPen(self._noise_color, 1, Qt.PenStyle.DotLine))
-            painter.drawLine(margin_left, noise_y, width - margin_right, noise_y)
-        
-        # 绘制音量波形
-        if len(self._volumes) > 1:
-            painter.setPen(QPen(self._line_color, 1.5))
-            
-            points_count = len(self._volumes)
-            x_step = graph_width / (points_count - 1) if points_count > 1 else 1
-            
-            prev_x = margin_left
-            prev_y = margin_top + graph_height
-            
-            for i, vol in enumerate(self._volumes):
-                x = margin_left + int(i * x_step)
-                # 限制音量值在范围内
-                vol_clamped = min(vol, self._max_volume)
-                y = margin_top + int(graph_height * (1 - vol_clamped / self._max_volume))
-                
-                if i > 0:
-                    painter.drawLine(prev_x, prev_y, x, y)
-                
-                prev_x = x
-                prev_y = y
-        
-        # 绘制触发标记
-        painter.setPen(QPen(self._trigger_color, 2))
-        current_idx = len(self._volumes)
-        for trigger_idx in self._trigger_points:
-            # 计算相对位置
-            relative_idx = trigger_idx - (current_idx - self._max_points)
-            if 0 <= relative_idx < self._max_points:
-                x = margin_left + int(relative_idx * graph_width / self._max_points)
-                painter.drawLine(x, margin_top, x, margin_top + graph_height)
-        
         # 底部标签
-        painter.setPen(QPen(self._text_color, 1))
         painter.drawText(margin_left, height - 5, "← 30秒前")
         painter.drawText(width - margin_right - 40, height - 5, "现在 →")
         
-        # 当前音量值
-        if self._volumes:
-            current_vol = self._volumes[-1]
-            painter.drawText(width - 100, margin_top + 15, f"当前: {current_vol:.4f}")
-        
         # 图例
         legend_x = margin_left + 100
         legend_y = height - 8
         
-        painter.setPen(QPen(self._line_color, 2))
+        painter.setPen(self._pen_legend_line)
         painter.drawLine(legend_x, legend_y, legend_x + 20, legend_y)
-        painter.setPen(QPen(self._text_color, 1))
+        painter.setPen(self._pen_text)
         painter.drawText(legend_x + 25, legend_y + 4, "音量")
         
-        painter.setPen(QPen(self._threshold_color, 2))
+        painter.setPen(self._pen_legend_threshold)
         painter.drawLine(legend_x + 70, legend_y, legend_x + 90, legend_y)
-        painter.setPen(QPen(self._text_color, 1))
+        painter.setPen(self._pen_text)
         painter.drawText(legend_x + 95, legend_y + 4, "阈值")
         
-        painter.setPen(QPen(self._trigger_color, 2))
+        painter.setPen(self._pen_trigger)
         painter.drawLine(legend_x + 140, legend_y, legend_x + 160, legend_y)
-        painter.setPen(QPen(self._text_color, 1))
+        painter.setPen(self._pen_text)
         painter.drawText(legend_x + 165, legend_y + 4, "触发")
+        painter.end()
+        
+        return pixmap
+    
+    def paintEvent(self, event) -> None:
+        """绘制事件"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        width = self.width()
+        height = self.height()
+        margin_left = self.MARGIN_LEFT
+        margin_right = self.MARGIN_RIGHT
+        margin_top = self.MARGIN_TOP
+        
+        graph_width = width - margin_left - margin_right
+        graph_height = height - margin_top - self.MARGIN_BOTTOM
+        
+        volumes, current_idx = self._history.snapshot()
+        
+        # 只重绘 Qt 给出的脏区域
+        painter.setClipRect(event.rect())
+        
+        # 背景、网格和标签只在尺寸或Y轴范围变化时重绘
+        if self._static_layer is None or self._static_max_volume != self._max_volume:
+            self._static_layer = self._render_static(width, height, graph_height)
+            self._static_max_volume = self._max_volume
+        painter.drawPixmap(0, 0, self._static_layer)
+        painter.setFont(self._font)
+        
+        # 有效阈值线（阈值 + 噪音基准）
+        effective_threshold = self._threshold + self._noise_floor
+        if effective_threshold < self._max_volume:
+            threshold_y = margin_top + int(graph_height * (1 - effective_threshold / self._max_volume))
+            painter.setPen(self._pen_threshold)
+            painter.drawLine(margin_left, threshold_y, width - margin_right, threshold_y)
+            if effective_threshold != self._threshold_text_key:
+                self._threshold_text = f"阈值: {effective_threshold:.4f}"
+                self._threshold_text_key = effective_threshold
+            painter.drawText(margin_left + 5, threshold_y - 5, self._threshold_text)
+        
+        # 噪音基准线
+        if self._noise_floor > 0 and self._noise_floor < self._max_volume:
+            noise_y = margin_top + int(graph_height * (1 - self._noise_floor / self._max_volume))
+            painter.setPen(self._pen_noise)
+            painter.drawLine(margin_left, noise_y, width - margin_right, noise_y)
+        
+        # 绘制音量波形
+        if len(volumes) > 1 and graph_width > 0 and graph_height > 0:
+            pad = self.WAVE_PAD
+            wave = self._render_wave(volumes, current_idx, graph_width, graph_height, pad)
+            painter.drawPixmap(margin_left - pad, margin_top - pad, wave)
+        
+        # 绘制触发标记，位置整体用 NumPy 计算，只保留仍在窗口内的标记
+        relative_idx = self._trigger_points - (current_idx - self._max_points)
+        relative_idx = relative_idx[(relative_idx >= 0) & (relative_idx < self._max_points)]
+        if len(relative_idx):
+            xs = (margin_left + relative_idx * graph_width // self._max_points).tolist()
+            bottom = margin_top + graph_height
+            painter.setPen(self._pen_trigger)
+            painter.drawLines([QLine(x, margin_top, x, bottom) for x in xs])
+        
+        # 当前音量值
+        if current_idx:
+            painter.setPen(self._pen_text)
+            current_vol = float(volumes[-1])
+            painter.drawText(width - 100, margin_top + 15, f"当前: {current_vol:.4f}")
@@ -3,13 +3,40 @@
 负责加载和保存用户配置
 """
 
+import contextlib
 import json
 import os
-from dataclasses import dataclass, asdict
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import ClassVar, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# 默认配置文件路径（slots 数据类的类属性是槽描述符，不能再通过 cls 读取字段默认值）
+DEFAULT_CONFIG_PATH = "config.json"
+
+
+def _loads(raw: bytes) -> dict:
+    """解析 JSON，安装了 orjson 时使用其 C 实现"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: dict) -> bytes:
+    """
+    序列化为 UTF-8 编码的 JSON（中文不转义，4 空格缩进）
+    
+    orjson 只支持 2 空格缩进，保存时统一使用标准库，
+    保持原有的文件格式且不受是否安装 orjson 影响（配置很小，序列化开销可忽略）
+    """
+    return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+
+
+@dataclass(slots=True)
 class Config:
     """配置数据类"""
     
@@ -33,7 +60,16 @@ class Config:
     sound_sensitivity: int = 50     # 灵敏度（0-100）
     
     # 配置文件路径
-    _config_path: str = "config.json"
+    _config_path: str = DEFAULT_CONFIG_PATH
+    
+    # 需要持久化的公开字段名（类定义完成后填充），以及加载和更新时允许的键
+    _PUBLIC_FIELDS: ClassVar[tuple[str, ...]] = ()
+    _ALLOWED_KEYS: ClassVar[frozenset[str]] = frozenset()
+    
+    # 灵敏度 0-100 对应的阈值表：sensitivity=0 -> 0.1, sensitivity=100 -> 0.005
+    _SENS_LUT: ClassVar[tuple[float, ...]] = tuple(
+        0.1 - (i / 100) * (0.1 - 0.005) for i in range(101)
+    )
     
     @classmethod
     def load(cls, config_path: Optional[str] = None) -> "Config":
@@ -46,15 +82,17 @@ class Config:
         Returns:
             Config 实例
         """
-        path = config_path or cls._config_path
+        path = config_path or DEFAULT_CONFIG_PATH
         
         if os.path.exists(path):
             try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 过滤掉私有属性
-                    filtered_data = {k: v for k, v in data.items() if not k.startswith('_')}
+                with open(path, 'rb') as f:
+                    # orjson.JSONDecodeError 是 json.JSONDecodeError 的子类
+                    data = _loads(f.read())
+                    # 只保留已知的公开字段，私有属性和未知键都会被丢弃
+                    filtered_data = {k: data[k] for k in data.keys() & cls._ALLOWED_KEYS}
                     config = cls(**filtered_data)
+                    config.normalize_keys()
                     config._config_path = path
                     return config
             except (json.JSONDecodeError, TypeError) as e:
@@ -77,12 +115,29 @@ class Config:
         path = config_path or self._config_path
         
         try:
-            data = asdict(self)
-            # 移除私有属性
-            data = {k: v for k, v in data.items() if not k.startswith('_')}
+            # 字段均为基本类型，直接按公开字段名取值，无需 asdict 深拷贝后再过滤
+            data = {k: getattr(self, k) for k in self._PUBLIC_FIELDS}
             
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
+            # 先在同一目录写唯一命名的临时文件再替换，中途崩溃不会留下被截断的配置文件，
+            # 同时进行的两次保存也不会争用同一个临时文件
+            # 临时文件用 'xb' 新建，权限按 umask 生成（NamedTemporaryFile 固定为 0600，
+            # 替换后会让配置文件变成仅所有者可读）；已有配置文件时沿用其权限
+            directory, name = os.path.split(os.path.abspath(path))
+            tmp_path = None
+            try:
+                candidate = os.path.join(directory, f"{name}.{os.urandom(4).hex()}.tmp")
+                with open(candidate, 'xb') as f:
+                    tmp_path = candidate
+                    f.write(_dumps(data))
+                with contextlib.suppress(FileNotFoundError):
+                    os.chmod(tmp_path, os.stat(path).st_mode & 0o7777)
+                os.replace(tmp_path, path)
+                tmp_path = None
+            finally:
+                # 写入或替换失败时删除残留的临时文件
+                if tmp_path is not None:
+                    with contextlib.suppress(OSError):
+                        os.unlink(tmp_path)
             return True
         except Exception as e:
             print(f"配置保存失败: {e}")
@@ -95,10 +150,18 @@ class Config:
         Args:
             **kwargs: 要更新的配置项
         """
+        allowed = self._ALLOWED_KEYS
         for key, value in kwargs.items():
-            if hasattr(self, key) and not key.startswith('_'):
+            if key in allowed:
                 setattr(self, key, value)
     
+    def normalize_keys(self) -> None:
+        """将快捷键规范化为小写并去除空白，按键解析时可直接查表"""
+        for name in ('pre_action_key', 'fishing_key', 'interact_key'):
+            value = getattr(self, name)
+            if isinstance(value, str) and value.strip():
+                setattr(self, name, value.strip().lower())
+    
     def get_hook_delay_range(self) -> tuple[int, int]:
         """获取收杆延迟范围（毫秒）"""
         return (self.hook_delay_min, self.hook_delay_max)
@@ -115,9 +178,12 @@ class Config:
         Returns:
             计算后的阈值
         """
-        # 灵敏度 0-100 映射到阈值 0.1-0.005
-        # 线性映射：sensitivity=0 -> threshold=0.1, sensitivity=100 -> threshold=0.005
-        max_threshold = 0.1
-        min_threshold = 0.005
-        self.sound_threshold = max_threshold - (self.sound_sensitivity / 100) * (max_threshold - min_threshold)
-        return self.sound_threshold
+        # 灵敏度 0-100 线性映射到阈值 0.1-0.005，直接查表，超出范围的取边界值
+        threshold = self._SENS_LUT[max(0, min(100, int(self.sound_sensitivity)))]
+        if threshold != self.sound_threshold:
+            self.sound_threshold = threshold
+        return threshold
+
+
+Config._PUBLIC_FIELDS = tuple(f.name for f in fields(Config) if not f.name.startswith('_'))
+Config._ALLOWED_KEYS = frozenset(Config._PUBLIC_FIELDS)